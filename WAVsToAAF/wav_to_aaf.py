@@ -22,20 +22,37 @@ Date: 2025-11-03
 
 import os
 import sys
-import wave
 import struct
 import argparse
 import csv
+import hashlib
 import re
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 __version__ = "1.0.0"
 __author__ = "Jason Brodkey"
 
+_GENERATOR_STR = f"WAVsToAAF v{__version__}"
+
+# Precompiled RIFF/BEXT layouts
+_CHUNK_HDR = struct.Struct('<4sI')         # chunk id, chunk size
+_FMT_PCM = struct.Struct('<HHIIHH')        # fmt chunk: tag, channels, rate, byte rate, align, bits
+_BEXT_HEAD = struct.Struct('<QH')          # time reference, version (offset 338)
+_BEXT_LOUD = struct.Struct('<hhhhh')       # loudness fields, BEXT v1+ (offset 412)
+# The only fmt format tag wave.open() accepted
+_WAVE_FORMAT_PCM = 0x0001
+_UMID_ZERO = bytes(64)
+
+def _cstr(buf: bytes, start: int, length: int) -> str:
+    """Decode a fixed-size, NUL-padded ASCII field without copying the padding"""
+    end = buf.find(b'\x00', start, start + length)
+    return buf[start:end if end != -1 else start + length].decode('ascii', errors='ignore')
+
 class WAVMetadataExtractor:
     """Extract metadata from WAV files including BEXT chunk data"""
     
@@ -44,90 +61,123 @@ class WAVMetadataExtractor:
     
     def extract_basic_info(self, wav_path: str) -> Dict:
         """Extract basic audio information from WAV file"""
-        try:
-            with wave.open(wav_path, 'rb') as wav_file:
-                frames = wav_file.getnframes()
-                sample_rate = wav_file.getframerate()
-                channels = wav_file.getnchannels()
-                sample_width = wav_file.getsampwidth()
-                duration = frames / sample_rate if sample_rate > 0 else 0
-                
-                return {
-                    'filename': Path(wav_path).name,
-                    'filepath': wav_path,
-                    'frames': frames,
-                    'sample_rate': sample_rate,
-                    'channels': channels,
-                    'sample_width': sample_width,
-                    'duration_seconds': duration,
-                    'duration_timecode': self._seconds_to_timecode(duration),
-                    'file_size': os.path.getsize(wav_path),
-                    'creation_time': datetime.fromtimestamp(os.path.getctime(wav_path)).isoformat(),
-                    'modification_time': datetime.fromtimestamp(os.path.getmtime(wav_path)).isoformat()
-                }
-        except Exception as e:
-            print(f"Error reading {wav_path}: {e}")
-            return {}
+        return self.scan_wav(wav_path)[0]
     
     def extract_bext_chunk(self, wav_path: str) -> Dict:
         """Extract BEXT chunk data from WAV file"""
+        return self.scan_wav(wav_path)[1]
+    
+    def scan_wav(self, wav_path: str, st: Optional[os.stat_result] = None,
+                 log: Callable[[str], None] = print) -> Tuple[Dict, Dict]:
+        """Extract basic audio information and BEXT data in a single RIFF chunk walk
+        
+        Returns (wav_metadata, bext_metadata). wav_metadata is empty if the file
+        could not be read; bext_metadata is empty if the file has no BEXT chunk.
+        st may be a stat_result already obtained for wav_path (e.g. from a
+        DirEntry) to avoid another stat call. Errors are reported through log,
+        so a caller can keep them with the file's other messages.
+        """
         bext_data = {}
         
         try:
-            with open(wav_path, 'rb') as f:
-                # Skip RIFF header
-                f.seek(12)
+            if st is None:
+                st = os.stat(wav_path)
+            fmt_fields = None
+            data_size = None
+            
+            # Larger buffer so the small header reads between seeks rarely hit the OS
+            with open(wav_path, 'rb', buffering=65536) as f:
+                riff_header = f.read(12)
+                if len(riff_header) < 12 or riff_header[:4] != b'RIFF' or riff_header[8:12] != b'WAVE':
+                    raise ValueError("file does not start with RIFF/WAVE id")
+                pos = 12
+                found_bext = False
                 
+                # Walk every chunk up to EOF: BEXT (and other metadata) may follow
+                # the audio data, whose payload is seeked over, never read
                 while True:
                     chunk_header = f.read(8)
                     if len(chunk_header) < 8:
                         break
                     
-                    chunk_id = chunk_header[:4].decode('ascii', errors='ignore')
-                    chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
+                    chunk_id, chunk_size = _CHUNK_HDR.unpack(chunk_header)
+                    
+                    if chunk_id == b'fmt ' and fmt_fields is None:
+                        fmt_raw = f.read(_FMT_PCM.size)
+                        if len(fmt_raw) < _FMT_PCM.size:
+                            raise ValueError("fmt chunk is truncated")
+                        # format tag, channels, sample rate, byte rate, block align, bits per sample
+                        fmt_fields = _FMT_PCM.unpack(fmt_raw)
+                    elif chunk_id == b'bext' and not found_bext:
+                        # Read BEXT chunk data (the first BEXT chunk wins)
+                        bext_data = self._parse_bext_chunk(f.read(chunk_size), log)
+                        found_bext = True
+                    elif chunk_id == b'data' and data_size is None:
+                        # Only the size is needed
+                        data_size = chunk_size
                     
-                    if chunk_id == 'bext':
-                        # Read BEXT chunk data
-                        bext_raw = f.read(chunk_size)
-                        bext_data = self._parse_bext_chunk(bext_raw)
+                    if fmt_fields is not None and data_size is not None and found_bext:
+                        # Nothing left to look for
                         break
-                    else:
-                        # Skip this chunk
-                        f.seek(chunk_size, 1)
-                        if chunk_size % 2:  # Align to word boundary
-                            f.seek(1, 1)
-        
+                    
+                    # Skip to the next chunk (word aligned) with one absolute seek
+                    pos += 8 + chunk_size + (chunk_size & 1)
+                    f.seek(pos)
+            
+            if fmt_fields is None or data_size is None:
+                raise ValueError("fmt chunk and/or data chunk missing")
+            
+            format_tag, channels, sample_rate, _, _, bits_per_sample = fmt_fields
+            if format_tag != _WAVE_FORMAT_PCM:
+                raise ValueError(f"unknown format: {format_tag}")
+            sample_width = (bits_per_sample + 7) // 8
+            if channels == 0 or sample_width == 0:
+                raise ValueError("bad fmt chunk")
+            frames = data_size // (channels * sample_width)
+            duration = frames / sample_rate if sample_rate > 0 else 0
+            
+            wav_metadata = {
+                'filename': os.path.basename(wav_path),
+                'filepath': wav_path,
+                'frames': frames,
+                'sample_rate': sample_rate,
+                'channels': channels,
+                'sample_width': sample_width,
+                'duration_seconds': duration,
+                'duration_timecode': self._seconds_to_timecode(duration),
+                'file_size': st.st_size,
+                'creation_time': datetime.fromtimestamp(st.st_ctime).isoformat(),
+                'modification_time': datetime.fromtimestamp(st.st_mtime).isoformat()
+            }
         except Exception as e:
-            print(f"Error reading BEXT from {wav_path}: {e}")
+            log(f"Error reading {wav_path}: {e}")
+            return {}, bext_data
         
-        return bext_data
+        return wav_metadata, bext_data
     
-    def _parse_bext_chunk(self, bext_data: bytes) -> Dict:
+    def _parse_bext_chunk(self, bext_data: bytes, log: Callable[[str], None] = print) -> Dict:
         """Parse BEXT chunk binary data"""
         if len(bext_data) < 602:  # Minimum BEXT size
             return {}
         
         try:
             # BEXT structure (EBU R68-2000)
-            description = bext_data[0:256].rstrip(b'\x00').decode('ascii', errors='ignore')
-            originator = bext_data[256:288].rstrip(b'\x00').decode('ascii', errors='ignore')
-            originator_ref = bext_data[288:320].rstrip(b'\x00').decode('ascii', errors='ignore')
-            origination_date = bext_data[320:330].rstrip(b'\x00').decode('ascii', errors='ignore')
-            origination_time = bext_data[330:338].rstrip(b'\x00').decode('ascii', errors='ignore')
-            time_reference = struct.unpack('<Q', bext_data[338:346])[0]
-            version = struct.unpack('<H', bext_data[346:348])[0]
+            description = _cstr(bext_data, 0, 256)
+            originator = _cstr(bext_data, 256, 32)
+            originator_ref = _cstr(bext_data, 288, 32)
+            origination_date = _cstr(bext_data, 320, 10)
+            origination_time = _cstr(bext_data, 330, 8)
+            time_reference, version = _BEXT_HEAD.unpack_from(bext_data, 338)
             
             # UMID (64 bytes)
-            umid = bext_data[348:412].hex().upper() if any(bext_data[348:412]) else ""
+            umid_raw = bext_data[348:412]
+            umid = umid_raw.hex().upper() if umid_raw != _UMID_ZERO else ""
             
             # Loudness info (if version >= 1)
             loudness_value = loudness_range = max_true_peak = max_momentary = max_short_term = 0
             if version >= 1 and len(bext_data) >= 602:
-                loudness_value = struct.unpack('<h', bext_data[412:414])[0]
-                loudness_range = struct.unpack('<h', bext_data[414:416])[0] 
-                max_true_peak = struct.unpack('<h', bext_data[416:418])[0]
-                max_momentary = struct.unpack('<h', bext_data[418:420])[0]
-                max_short_term = struct.unpack('<h', bext_data[420:422])[0]
+                (loudness_value, loudness_range, max_true_peak,
+                 max_momentary, max_short_term) = _BEXT_LOUD.unpack_from(bext_data, 412)
             
             return {
                 'description': description,
@@ -146,7 +196,7 @@ class WAVMetadataExtractor:
             }
         
         except Exception as e:
-            print(f"Error parsing BEXT data: {e}")
+            log(f"Error parsing BEXT data: {e}")
             return {}
     
     def _seconds_to_timecode(self, seconds: float, fps: int = 25) -> str:
@@ -157,12 +207,41 @@ class WAVMetadataExtractor:
         frames = int((seconds % 1) * fps)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}:{frames:02d}"
 
+def _resolve_columns(columns: Dict[str, int], *names: str) -> Tuple[int, ...]:
+    """Return the indices of the named CSV columns that exist, in the given order"""
+    return tuple(columns[name] for name in names if name in columns)
+
+def _first_field(row: List[str], cols: Tuple[int, ...]) -> str:
+    """Return the first non-empty value of row at the given column indices"""
+    for i in cols:
+        if i < len(row) and row[i]:
+            return row[i]
+    return ''
+
+def _long_substrings(word: str) -> set:
+    """Return the distinct substrings of word longer than 3 characters"""
+    n = len(word)
+    return {word[start:end] for start in range(n - 3) for end in range(start + 4, n + 1)}
+
 class UCSProcessor:
     """Process Universal Category System (UCS) data for sound categorization"""
     
+    # Text normalization used by categorize_sound
+    _EXT_RE = re.compile(r'\.wave?$')
+    _SEP_TRANS = str.maketrans('_-.', '   ')
+    
     def __init__(self):
         self.ucs_data = {}
         self.ucs_loaded = False
+        # Candidate index built by _build_index (see categorize_sound)
+        self._ucs_ids: List[str] = []
+        self._token_to_ids: Dict[str, set] = {}
+        self._token_lengths: List[int] = []
+        self._name_substr_counts: Dict[str, Dict[int, int]] = {}
+        self._long_name_word_ids: Dict[str, List[int]] = {}
+        self._always_ids: set = set()
+        # categorize_sound results keyed by normalized text (batches repeat stems)
+        self._cat_cache: Dict[str, Dict] = {}
         self.load_ucs_data()
     
     def load_ucs_data(self):
@@ -177,35 +256,144 @@ class UCSProcessor:
         for ucs_file in ucs_files:
             if ucs_file.exists():
                 try:
-                    with open(ucs_file, 'r', encoding='utf-8') as csvfile:
-                        reader = csv.DictReader(csvfile)
-                        for row in reader:
-                            # Handle both old and new CSV formats
-                            ucs_id = row.get('ID') or row.get('CatID') or row.get('CatShort', '')
-                            full_name = row.get('FullName') or f"{row.get('Category', '')} {row.get('SubCategory', '')}".strip()
-                            category = row.get('Category', '')
-                            subcategory = row.get('SubCategory', '')
-                            description = row.get('Description') or row.get('Explanations', '')
-                            keywords_str = row.get('Keywords') or row.get('Synonyms - Comma Separated', '')
-                            
-                            if ucs_id and category:
-                                self.ucs_data[ucs_id] = {
-                                    'id': ucs_id,
-                                    'full_name': full_name,
-                                    'category': category,
-                                    'subcategory': subcategory,
-                                    'description': description,
-                                    'keywords': [k.strip() for k in keywords_str.split(',') if k.strip()] if keywords_str else []
-                                }
+                    self._read_ucs_csv(ucs_file)
+                    self._build_index()
                     self.ucs_loaded = True
                     print(f"Loaded {len(self.ucs_data)} UCS categories from {ucs_file.name}")
                     break
                 except Exception as e:
                     print(f"Warning: Could not load UCS file {ucs_file}: {e}")
+                    # Drop any partially parsed rows before trying the next candidate
+                    self.ucs_data = {}
         
         if not self.ucs_loaded:
             print("Warning: No UCS file found. UCS categorization will be disabled.")
     
+    def _read_ucs_csv(self, ucs_file: Path):
+        """Parse a UCS CSV file into self.ucs_data"""
+        # Large buffer so the whole list is read in a few syscalls
+        with open(ucs_file, 'r', encoding='utf-8', newline='', buffering=262144) as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            # Handle both old and new CSV formats: resolve each field's candidate
+            # columns once, in order of preference
+            columns = {name: i for i, name in enumerate(header)}
+            id_cols = _resolve_columns(columns, 'ID', 'CatID', 'CatShort')
+            full_name_cols = _resolve_columns(columns, 'FullName')
+            category_cols = _resolve_columns(columns, 'Category')
+            subcategory_cols = _resolve_columns(columns, 'SubCategory')
+            description_cols = _resolve_columns(columns, 'Description', 'Explanations')
+            keywords_cols = _resolve_columns(columns, 'Keywords', 'Synonyms - Comma Separated')
+            
+            for row in reader:
+                ucs_id = _first_field(row, id_cols)
+                category = _first_field(row, category_cols)
+                subcategory = _first_field(row, subcategory_cols)
+                full_name = _first_field(row, full_name_cols) or f"{category} {subcategory}".strip()
+                description = _first_field(row, description_cols)
+                keywords_str = _first_field(row, keywords_cols)
+                
+                if ucs_id and category:
+                    keywords = [k.strip() for k in keywords_str.split(',') if k.strip()] if keywords_str else []
+                    full_name_l = full_name.lower()
+                    category_l = category.lower()
+                    subcategory_l = subcategory.lower()
+                    self.ucs_data[ucs_id] = {
+                        'id': ucs_id,
+                        'full_name': full_name,
+                        'category': category,
+                        'subcategory': subcategory,
+                        'description': description,
+                        'keywords': keywords,
+                        # Lowercased forms used by _calculate_match_score, computed once here
+                        # instead of once per (file x category) comparison
+                        '_full_name_l': full_name_l,
+                        '_category_l': category_l,
+                        '_subcategory_l': subcategory_l,
+                        '_keywords_l': tuple(k.lower() for k in keywords),
+                        '_name_words': frozenset(w for w in full_name_l.split() if len(w) > 2),
+                        '_cat_words': frozenset(w for w in category_l.split() if len(w) > 2),
+                        '_subcat_words': frozenset(w for w in subcategory_l.split() if len(w) > 2),
+                        '_name_words_long': frozenset(w for w in full_name_l.split() if len(w) > 3)
+                    }
+    
+    def _build_index(self):
+        """Build lookup tables mapping match strings to the UCS rows they can score
+        
+        Every scoring rule in _calculate_match_score is either "some lowercase
+        string of the row occurs in the text" or the partial rule "a text word
+        and a name word contain one another". Indexing those strings lets
+        categorize_sound score only rows that can possibly match instead of the
+        whole list, and count partial matches by lookup (see _partial_matches).
+        Rows are referenced by load order so ties still resolve the same way.
+        """
+        self._ucs_ids = list(self.ucs_data)
+        self._token_to_ids = {}
+        self._name_substr_counts = {}
+        self._long_name_word_ids = {}
+        self._always_ids = set()
+        
+        for idx, ucs_id in enumerate(self._ucs_ids):
+            info = self.ucs_data[ucs_id]
+            tokens = {info['_full_name_l'], info['_category_l'], info['_subcategory_l']}
+            tokens.update(info['_keywords_l'])
+            tokens.update(info['_name_words'])
+            tokens.update(info['_cat_words'])
+            tokens.update(info['_subcat_words'])
+            for token in tokens:
+                if token:
+                    self._token_to_ids.setdefault(token, set()).add(idx)
+                else:
+                    # An empty string is "in" any text, so the row always scores
+                    self._always_ids.add(idx)
+            
+            # Long name words, and how many of them contain each substring (> 3 chars)
+            for name_word in info['_name_words_long']:
+                self._long_name_word_ids.setdefault(name_word, []).append(idx)
+                for substr in _long_substrings(name_word):
+                    counts = self._name_substr_counts.setdefault(substr, {})
+                    counts[idx] = counts.get(idx, 0) + 1
+        
+        self._token_lengths = sorted({len(token) for token in self._token_to_ids})
+    
+    def _partial_matches(self, text_words_ge4: frozenset) -> Dict[int, int]:
+        """Count, per UCS row, the (text word, name word) pairs where one contains the other
+        
+        Only words longer than 3 characters take part, as in the original
+        pairwise loop over each row's name words.
+        """
+        partial: Dict[int, int] = {}
+        for text_word in text_words_ge4:
+            # text_word in name_word (including equal words)
+            counts = self._name_substr_counts.get(text_word)
+            if counts:
+                for idx, count in counts.items():
+                    partial[idx] = partial.get(idx, 0) + count
+            # name_word strictly inside text_word
+            for substr in _long_substrings(text_word):
+                if substr != text_word:
+                    for idx in self._long_name_word_ids.get(substr, ()):
+                        partial[idx] = partial.get(idx, 0) + 1
+        return partial
+    
+    def _candidate_rows(self, text: str, partial: Dict[int, int]) -> List[int]:
+        """Return indices (in load order) of UCS rows that can score above zero for text"""
+        candidates = set(self._always_ids)
+        candidates.update(partial)
+        token_to_ids = self._token_to_ids
+        
+        # Any indexed string occurring anywhere in the text
+        text_len = len(text)
+        for length in self._token_lengths:
+            if length > text_len:
+                break
+            for start in range(text_len - length + 1):
+                ids = token_to_ids.get(text[start:start + length])
+                if ids:
+                    candidates.update(ids)
+        
+        return sorted(candidates)
+    
     def categorize_sound(self, filename: str, description: str = "") -> Dict:
         """Categorize sound based on filename and description"""
         if not self.ucs_loaded:
@@ -215,14 +403,24 @@ class UCSProcessor:
         text_to_analyze = f"{filename} {description}".lower()
         
         # Remove file extension and common separators
-        text_to_analyze = re.sub(r'\.(wav|wave)$', '', text_to_analyze)
-        text_to_analyze = re.sub(r'[_\-\.]', ' ', text_to_analyze)
+        text_to_analyze = self._EXT_RE.sub('', text_to_analyze).translate(self._SEP_TRANS)
+        
+        cached = self._cat_cache.get(text_to_analyze)
+        if cached is not None:
+            return cached
+        
+        # Word sets shared by every row's score
+        text_words_ge3 = frozenset(w for w in text_to_analyze.split() if len(w) > 2)
+        text_words_ge4 = frozenset(w for w in text_words_ge3 if len(w) > 3)
         
         # Score each UCS category
         best_matches = []
         
-        for ucs_id, ucs_info in self.ucs_data.items():
-            score = self._calculate_match_score(text_to_analyze, ucs_info)
+        partial = self._partial_matches(text_words_ge4)
+        for idx in self._candidate_rows(text_to_analyze, partial):
+            ucs_id = self._ucs_ids[idx]
+            ucs_info = self.ucs_data[ucs_id]
+            score = self._calculate_match_score(text_to_analyze, text_words_ge3, ucs_info, partial.get(idx, 0))
             if score > 0:
                 best_matches.append((score, ucs_id, ucs_info))
         
@@ -257,102 +455,147 @@ class UCSProcessor:
             
             if alternatives:
                 result['alternative_categories'] = alternatives
-            
-            return result
+        else:
+            result = {}
         
-        return {}
+        self._cat_cache[text_to_analyze] = result
+        return result
     
-    def _calculate_match_score(self, text: str, ucs_info: Dict) -> float:
-        """Calculate match score between text and UCS category"""
+    def _calculate_match_score(self, text: str, text_words_ge3: frozenset,
+                               ucs_info: Dict, partial_matches: int = 0) -> float:
+        """Calculate match score between text and UCS category
+        
+        text_words_ge3 are the words of text longer than 2 characters and
+        partial_matches is the row's count from _partial_matches. ucs_info must
+        carry the precomputed lowercase fields added by load_ucs_data.
+        """
         score = 0.0
         
         # Check full name match
-        full_name = ucs_info['full_name'].lower()
-        if full_name in text:
+        if ucs_info['_full_name_l'] in text:
             score += 10.0
         
         # Check category and subcategory
-        category = ucs_info['category'].lower()
-        subcategory = ucs_info['subcategory'].lower()
-        
-        if category in text:
+        if ucs_info['_category_l'] in text:
             score += 5.0
-        if subcategory in text:
+        if ucs_info['_subcategory_l'] in text:
             score += 7.0
         
         # Check keywords
-        for keyword in ucs_info['keywords']:
-            keyword = keyword.strip().lower()
-            if keyword and keyword in text:
+        for keyword in ucs_info['_keywords_l']:
+            if keyword in text:
                 score += 3.0
         
         # Check word-level matches
-        text_words = set(text.split())
-        name_words = set(full_name.split())
-        category_words = set(category.split())
-        subcategory_words = set(subcategory.split())
-        
-        # Exact word matches get higher scores
-        for word in text_words:
-            if len(word) > 2:  # Skip very short words
-                if word in name_words:
-                    score += 2.0
-                elif word in category_words:
-                    score += 1.5
-                elif word in subcategory_words:
-                    score += 1.5
+        name_words = ucs_info['_name_words']
+        category_words = ucs_info['_cat_words']
+        subcategory_words = ucs_info['_subcat_words']
+        
+        # Exact word matches get higher scores (very short words are skipped)
+        for word in text_words_ge3:
+            if word in name_words:
+                score += 2.0
+            elif word in category_words:
+                score += 1.5
+            elif word in subcategory_words:
+                score += 1.5
         
         # Partial word matches
-        for text_word in text_words:
-            if len(text_word) > 3:
-                for name_word in name_words:
-                    if len(name_word) > 3 and (text_word in name_word or name_word in text_word):
-                        score += 0.5
+        score += 0.5 * partial_matches
         
         return score
 
+def _append_leaves(parent: ET.Element, items) -> None:
+    """Append text-only child elements built from (tag, text) pairs in one extend"""
+    children = []
+    for tag, text in items:
+        child = ET.Element(tag)
+        child.text = text
+        children.append(child)
+    parent.extend(children)
+
+# BEXT dict key -> element tag (e.g. 'time_reference' -> 'Timereference')
+_BEXT_TAGS: Dict[str, str] = {}
+
+def _bext_tag(key: str) -> str:
+    """Return the BextMetadata element tag for a BEXT dict key"""
+    tag = _BEXT_TAGS.get(key)
+    if tag is None:
+        tag = _BEXT_TAGS[key] = key.replace('_', '').title()
+    return tag
+
+def _ucs_category_fields(category: Dict) -> Tuple[Tuple[str, str], ...]:
+    """(tag, text) pairs for a PrimaryCategory/Category element"""
+    return (
+        ("ID", category['id']),
+        ("FullName", category['full_name']),
+        ("Category", category['category']),
+        ("SubCategory", category['subcategory']),
+        ("MatchScore", str(category['score']))
+    )
+
 class AAFGenerator:
     """Generate simplified AAF XML files from WAV metadata"""
     
     def __init__(self):
         self.namespace = "http://www.aafassociation.org/aafxml"
+        self._mob_id_cache: Dict[str, str] = {}
     
     def create_aaf_xml(self, wav_metadata: Dict, bext_metadata: Dict, ucs_metadata: Dict = None) -> str:
         """Create simplified AAF XML from WAV, BEXT, and UCS metadata"""
+        return self._prettify_xml(self.build_aaf_tree(wav_metadata, bext_metadata, ucs_metadata))
+    
+    def write_aaf(self, root: ET.Element, output_file) -> None:
+        """Indent and write an AAF tree straight to disk without building a string first"""
+        ET.indent(root, space="  ")
+        with open(output_file, 'wb') as f:
+            f.write(b'<?xml version="1.0" ?>\n')
+            ET.ElementTree(root).write(f, encoding='utf-8')
+            f.write(b'\n')
+    
+    def build_aaf_tree(self, wav_metadata: Dict, bext_metadata: Dict, ucs_metadata: Dict = None) -> ET.Element:
+        """Build the simplified AAF element tree from WAV, BEXT, and UCS metadata"""
+        
+        now_iso = datetime.now().isoformat()
         
         # Create root element
-        root = ET.Element("AAF")
-        root.set("xmlns", self.namespace)
-        root.set("version", "1.1")
-        root.set("generator", f"WAVsToAAF v{__version__}")
-        root.set("timestamp", datetime.now().isoformat())
+        root = ET.Element("AAF", {
+            "xmlns": self.namespace,
+            "version": "1.1",
+            "generator": _GENERATOR_STR,
+            "timestamp": now_iso
+        })
         
         # Header
         header = ET.SubElement(root, "Header")
-        ET.SubElement(header, "Version").text = "1.1"
-        ET.SubElement(header, "Generator").text = f"WAVsToAAF v{__version__}"
-        ET.SubElement(header, "CreationTime").text = datetime.now().isoformat()
+        _append_leaves(header, (
+            ("Version", "1.1"),
+            ("Generator", _GENERATOR_STR),
+            ("CreationTime", now_iso)
+        ))
         
         # Content Storage
         content = ET.SubElement(root, "ContentStorage")
         
         # Master Mob
-        master_mob = ET.SubElement(content, "MasterMob")
         mob_id = self._generate_mob_id(wav_metadata.get('filename', 'unknown'))
-        master_mob.set("MobID", mob_id)
+        master_mob = ET.SubElement(content, "MasterMob", MobID=mob_id)
         
         # Mob properties
-        ET.SubElement(master_mob, "Name").text = wav_metadata.get('filename', 'Unknown')
-        ET.SubElement(master_mob, "CreationTime").text = wav_metadata.get('creation_time', '')
-        ET.SubElement(master_mob, "LastModified").text = wav_metadata.get('modification_time', '')
+        _append_leaves(master_mob, (
+            ("Name", wav_metadata.get('filename', 'Unknown')),
+            ("CreationTime", wav_metadata.get('creation_time', '')),
+            ("LastModified", wav_metadata.get('modification_time', ''))
+        ))
         
         # Add BEXT metadata if available
         if bext_metadata:
             bext_elem = ET.SubElement(master_mob, "BextMetadata")
-            for key, value in bext_metadata.items():
-                if value is not None and value != "":
-                    elem = ET.SubElement(bext_elem, key.replace('_', '').title())
-                    elem.text = str(value)
+            _append_leaves(bext_elem, (
+                (_bext_tag(key), str(value))
+                for key, value in bext_metadata.items()
+                if value is not None and value != ""
+            ))
         
         # Add UCS metadata if available
         if ucs_metadata:
@@ -360,74 +603,76 @@ class AAFGenerator:
             
             # Primary category
             if 'primary_category' in ucs_metadata:
-                primary = ucs_metadata['primary_category']
                 primary_elem = ET.SubElement(ucs_elem, "PrimaryCategory")
-                ET.SubElement(primary_elem, "ID").text = primary['id']
-                ET.SubElement(primary_elem, "FullName").text = primary['full_name']
-                ET.SubElement(primary_elem, "Category").text = primary['category']
-                ET.SubElement(primary_elem, "SubCategory").text = primary['subcategory']
-                ET.SubElement(primary_elem, "MatchScore").text = str(primary['score'])
+                _append_leaves(primary_elem, _ucs_category_fields(ucs_metadata['primary_category']))
             
             # Alternative categories
             if 'alternative_categories' in ucs_metadata and ucs_metadata['alternative_categories']:
                 alternatives_elem = ET.SubElement(ucs_elem, "AlternativeCategories")
                 for alt in ucs_metadata['alternative_categories']:
                     alt_elem = ET.SubElement(alternatives_elem, "Category")
-                    ET.SubElement(alt_elem, "ID").text = alt['id']
-                    ET.SubElement(alt_elem, "FullName").text = alt['full_name']
-                    ET.SubElement(alt_elem, "Category").text = alt['category']
-                    ET.SubElement(alt_elem, "SubCategory").text = alt['subcategory']
-                    ET.SubElement(alt_elem, "MatchScore").text = str(alt['score'])
+                    _append_leaves(alt_elem, _ucs_category_fields(alt))
         
         # Timeline Mob Slot
-        timeline_slot = ET.SubElement(master_mob, "TimelineMobSlot")
-        timeline_slot.set("SlotID", "1")
-        ET.SubElement(timeline_slot, "SlotName").text = "Audio"
-        ET.SubElement(timeline_slot, "EditRate").text = str(wav_metadata.get('sample_rate', 48000))
+        timeline_slot = ET.SubElement(master_mob, "TimelineMobSlot", SlotID="1")
+        _append_leaves(timeline_slot, (
+            ("SlotName", "Audio"),
+            ("EditRate", str(wav_metadata.get('sample_rate', 48000)))
+        ))
         
         # Source Clip
         source_clip = ET.SubElement(timeline_slot, "SourceClip")
-        ET.SubElement(source_clip, "StartTime").text = "0"
-        ET.SubElement(source_clip, "Length").text = str(wav_metadata.get('frames', 0))
+        _append_leaves(source_clip, (
+            ("StartTime", "0"),
+            ("Length", str(wav_metadata.get('frames', 0)))
+        ))
         
         # Audio properties
         audio_props = ET.SubElement(source_clip, "AudioProperties")
-        ET.SubElement(audio_props, "SampleRate").text = str(wav_metadata.get('sample_rate', 0))
-        ET.SubElement(audio_props, "Channels").text = str(wav_metadata.get('channels', 0))
-        ET.SubElement(audio_props, "SampleWidth").text = str(wav_metadata.get('sample_width', 0))
-        ET.SubElement(audio_props, "Duration").text = wav_metadata.get('duration_timecode', '00:00:00:00')
-        ET.SubElement(audio_props, "FileSize").text = str(wav_metadata.get('file_size', 0))
+        _append_leaves(audio_props, (
+            ("SampleRate", str(wav_metadata.get('sample_rate', 0))),
+            ("Channels", str(wav_metadata.get('channels', 0))),
+            ("SampleWidth", str(wav_metadata.get('sample_width', 0))),
+            ("Duration", wav_metadata.get('duration_timecode', '00:00:00:00')),
+            ("FileSize", str(wav_metadata.get('file_size', 0)))
+        ))
         
         # File Reference
         file_ref = ET.SubElement(source_clip, "FileReference")
-        ET.SubElement(file_ref, "FileName").text = wav_metadata.get('filename', '')
-        ET.SubElement(file_ref, "FilePath").text = wav_metadata.get('filepath', '')
+        _append_leaves(file_ref, (
+            ("FileName", wav_metadata.get('filename', '')),
+            ("FilePath", wav_metadata.get('filepath', ''))
+        ))
         
-        return self._prettify_xml(root)
+        return root
     
     def _generate_mob_id(self, filename: str) -> str:
         """Generate a simple Mob ID based on filename"""
-        # Simple hash-based ID generation
-        import hashlib
-        hash_obj = hashlib.md5(filename.encode())
-        hash_hex = hash_obj.hexdigest()
-        return f"urn:uuid:{hash_hex[:8]}-{hash_hex[8:12]}-{hash_hex[12:16]}-{hash_hex[16:20]}-{hash_hex[20:32]}"
+        mob_id = self._mob_id_cache.get(filename)
+        if mob_id is not None:
+            return mob_id
+        
+        # Simple hash-based ID generation (MD5 keeps IDs stable across versions)
+        hash_hex = hashlib.md5(filename.encode()).hexdigest()
+        mob_id = f"urn:uuid:{hash_hex[:8]}-{hash_hex[8:12]}-{hash_hex[12:16]}-{hash_hex[16:20]}-{hash_hex[20:32]}"
+        self._mob_id_cache[filename] = mob_id
+        return mob_id
     
     def _prettify_xml(self, elem: ET.Element) -> str:
         """Return a pretty-printed XML string"""
-        rough_string = ET.tostring(elem, 'unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")
+        ET.indent(elem, space="  ")
+        return '<?xml version="1.0" ?>\n' + ET.tostring(elem, encoding='unicode') + '\n'
 
 class WAVsToAAFProcessor:
     """Main processor class for converting WAV files to AAF format"""
     
-    def __init__(self):
+    def __init__(self, ucs_processor: Optional[UCSProcessor] = None):
         self.extractor = WAVMetadataExtractor()
         self.generator = AAFGenerator()
-        self.ucs_processor = UCSProcessor()
+        # An already loaded UCSProcessor may be shared (see _init_worker)
+        self.ucs_processor = ucs_processor if ucs_processor is not None else UCSProcessor()
     
-    def process_directory(self, input_dir: str, output_dir: str) -> int:
+    def process_directory(self, input_dir: str, output_dir: str, processes: int = 0) -> int:
         """Process all WAV files in a directory"""
         input_path = Path(input_dir)
         output_path = Path(output_dir)
@@ -440,10 +685,7 @@ class WAVsToAAFProcessor:
         output_path.mkdir(parents=True, exist_ok=True)
         
         # Find WAV files
-        wav_files = []
-        for ext in self.extractor.supported_formats:
-            wav_files.extend(input_path.glob(f"**/*{ext}"))
-            wav_files.extend(input_path.glob(f"**/*{ext.upper()}"))
+        wav_files = list(self._iter_wavs(input_dir))
         
         if not wav_files:
             print(f"No WAV files found in '{input_dir}'")
@@ -452,56 +694,121 @@ class WAVsToAAFProcessor:
         print(f"Found {len(wav_files)} WAV file(s) to process...")
         
         processed = 0
-        for wav_file in wav_files:
-            try:
-                print(f"Processing: {wav_file.name}")
-                
-                # Extract metadata
-                wav_metadata = self.extractor.extract_basic_info(str(wav_file))
-                bext_metadata = self.extractor.extract_bext_chunk(str(wav_file))
-                
-                if not wav_metadata:
-                    print(f"  Skipping {wav_file.name}: Could not read metadata")
-                    continue
-                
-                # UCS categorization
-                ucs_metadata = self.ucs_processor.categorize_sound(
-                    wav_file.name, 
-                    bext_metadata.get('description', '')
-                )
-                
-                if ucs_metadata and 'primary_category' in ucs_metadata:
-                    category = ucs_metadata['primary_category']
-                    print(f"  UCS Category: {category['category']} > {category['subcategory']} ({category['score']:.1f})")
-                
-                # Generate AAF XML
-                aaf_xml = self.generator.create_aaf_xml(wav_metadata, bext_metadata, ucs_metadata)
-                
-                # Write output file
-                output_filename = wav_file.stem + '.aaf.xml'
-                output_file = output_path / output_filename
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(aaf_xml)
-                
-                print(f"  Created: {output_filename}")
-                processed += 1
-                
-            except Exception as e:
-                print(f"  Error processing {wav_file.name}: {e}")
+        if processes and processes > 1:
+            # UCS scoring is pure Python, so spread it across processes; each
+            # worker receives this processor's loaded UCS data and index once
+            executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                           initargs=(self.ucs_processor,))
+            worker = _process_in_worker
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+            worker = self._process_group
+        
+        # Same-named WAVs from different folders write the same output file, so
+        # each such group runs as one task in walk order and the last file wins,
+        # as in a sequential run (lowercased for case-insensitive file systems)
+        groups = {}
+        order = []
+        for wav_file, wav_stat in wav_files:
+            key = os.path.splitext(os.path.basename(wav_file))[0].lower()
+            group = groups.setdefault(key, [])
+            order.append((key, len(group)))
+            group.append((wav_file, wav_stat))
+        
+        with executor:
+            futures = {key: executor.submit(worker, group, output_path)
+                       for key, group in groups.items()}
+            # Collect in walk order so the log reads in directory-walk order
+            for key, index in order:
+                ok, messages = futures[key].result()[index]
+                print("\n".join(messages))
+                processed += ok
         
         print(f"\nCompleted! Processed {processed} file(s)")
         print(f"Output files saved to: {output_dir}")
         return 0
     
+    def _process_group(self, group: List[Tuple[str, Optional[os.stat_result]]],
+                       output_path: Path) -> List[Tuple[int, List[str]]]:
+        """Convert WAV files that share an output name one after another, in order"""
+        return [self._process_one(wav_file, wav_stat, output_path) for wav_file, wav_stat in group]
+    
+    def _process_one(self, wav_file: str, wav_stat: Optional[os.stat_result], output_path: Path) -> Tuple[int, List[str]]:
+        """Convert one WAV file for process_directory
+        
+        Returns (1 if an AAF file was written else 0, messages to print).
+        """
+        wav_name = os.path.basename(wav_file)
+        messages = [f"Processing: {wav_name}"]
+        try:
+            # Extract metadata
+            # Errors go to this file's (indented) messages, printed in order by process_directory
+            wav_metadata, bext_metadata = self.extractor.scan_wav(
+                wav_file, wav_stat, lambda msg: messages.append(f"  {msg}"))
+            
+            if not wav_metadata:
+                messages.append(f"  Skipping {wav_name}: Could not read metadata")
+                return 0, messages
+            
+            # UCS categorization
+            ucs_metadata = self.ucs_processor.categorize_sound(
+                wav_name, 
+                bext_metadata.get('description', '')
+            )
+            
+            if ucs_metadata and 'primary_category' in ucs_metadata:
+                category = ucs_metadata['primary_category']
+                messages.append(f"  UCS Category: {category['category']} > {category['subcategory']} ({category['score']:.1f})")
+            
+            # Generate AAF XML
+            aaf_root = self.generator.build_aaf_tree(wav_metadata, bext_metadata, ucs_metadata)
+            
+            # Write output file
+            output_filename = os.path.splitext(wav_name)[0] + '.aaf.xml'
+            output_file = output_path / output_filename
+            
+            self.generator.write_aaf(aaf_root, output_file)
+            
+            messages.append(f"  Created: {output_filename}")
+            return 1, messages
+            
+        except Exception as e:
+            messages.append(f"  Error processing {wav_name}: {e}")
+            return 0, messages
+    
+    def _iter_wavs(self, root: str):
+        """Yield (path, stat_result) for WAV files under root using a stack-based os.scandir walk.
+        
+        DirEntry caches the file type from the directory read, so no extra stat
+        is needed per entry, and the lowercased suffix check covers .WAV/.Wav too.
+        The stat_result is None if the entry could not be stat'ed; scan_wav will
+        then retry and report the error.
+        """
+        suffixes = tuple(self.extractor.supported_formats)
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(suffixes):
+                            try:
+                                st = entry.stat()
+                            except OSError:
+                                st = None
+                            yield entry.path, st
+            except OSError as e:
+                print(f"Warning: Could not scan directory {directory}: {e}")
+    
     def process_single_file(self, wav_file: str, output_file: str) -> int:
         """Process a single WAV file"""
         try:
             print(f"Processing: {wav_file}")
             
             # Extract metadata
-            wav_metadata = self.extractor.extract_basic_info(wav_file)
-            bext_metadata = self.extractor.extract_bext_chunk(wav_file)
+            wav_metadata, bext_metadata = self.extractor.scan_wav(wav_file)
             
             if not wav_metadata:
                 print(f"Error: Could not read metadata from {wav_file}")
@@ -518,11 +825,10 @@ class WAVsToAAFProcessor:
                 print(f"UCS Category: {category['category']} > {category['subcategory']} ({category['score']:.1f})")
             
             # Generate AAF XML
-            aaf_xml = self.generator.create_aaf_xml(wav_metadata, bext_metadata, ucs_metadata)
+            aaf_root = self.generator.build_aaf_tree(wav_metadata, bext_metadata, ucs_metadata)
             
             # Write output file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(aaf_xml)
+            self.generator.write_aaf(aaf_root, output_file)
             
             print(f"Created: {output_file}")
             return 0
@@ -531,6 +837,19 @@ class WAVsToAAFProcessor:
             print(f"Error processing {wav_file}: {e}")
             return 1
 
+# Per-process state for process_directory(processes=N)
+_worker_processor = None
+
+def _init_worker(ucs_processor: UCSProcessor):
+    """ProcessPoolExecutor initializer: build the worker's processor around the parent's UCS data"""
+    global _worker_processor
+    _worker_processor = WAVsToAAFProcessor(ucs_processor)
+
+def _process_in_worker(group: List[Tuple[str, Optional[os.stat_result]]],
+                       output_path: Path) -> List[Tuple[int, List[str]]]:
+    """Run WAVsToAAFProcessor._process_group in a worker process"""
+    return _worker_processor._process_group(group, output_path)
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -551,6 +870,8 @@ Examples:
                         help='Output directory or file (default: ./aaf_output)')
     parser.add_argument('-f', '--file', action='store_true',
                         help='Process single file instead of directory')
+    parser.add_argument('-p', '--processes', type=int, default=0, metavar='N',
+                        help='Use N worker processes for large directories (default: threads)')
     parser.add_argument('-v', '--version', action='version',
                         version=f'WAVsToAAF {__version__}')
     
@@ -561,7 +882,9 @@ Examples:
     if args.file:
         return processor.process_single_file(args.input, args.output)
     else:
-        return processor.process_directory(args.input, args.output)
+        return processor.process_directory(args.input, args.output, args.processes)
 
 if __name__ == "__main__":
+    # Needed for --processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     sys.exit(main())
\ No newline at end of file
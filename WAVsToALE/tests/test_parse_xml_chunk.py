@@ -0,0 +1,54 @@
+"""parse_xml_chunk() results for well-formed and malformed ebuCore chunks.
+
+Run from the repository root with: python -m unittest discover WAVsToALE/tests
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'wav_to_ale_with_bext_xml_v2_plusUCS-Parsing.py')
+
+spec = importlib.util.spec_from_file_location('wav_to_ale', SCRIPT)
+wav_to_ale = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(wav_to_ale)
+
+ROOT = b'<ebucore:ebuCoreMain xmlns:ebucore="urn:ebu:metadata-schema:ebuCore_2014">'
+END = b'</ebucore:ebuCoreMain>'
+
+BIRDS = {'title': 'Birds'}
+
+# chunk -> expected metadata; elements closed before the first error are kept
+CASES = {
+    'well formed': (ROOT + b'<ebucore:title>Birds</ebucore:title><ebucore:creator>Me</ebucore:creator>' + END,
+                    {'title': 'Birds', 'creator': 'Me'}),
+    'mismatched tag': (ROOT + b'<ebucore:title>Birds</ebucore:title><a>1</b><c>2</c>' + END, BIRDS),
+    'truncated': (ROOT + b'<ebucore:title>Birds</ebucore:title><a>1', BIRDS),
+    'undefined entity': (ROOT + b'<ebucore:title>Birds</ebucore:title><a>x &bad; y</a><c>2</c>' + END, BIRDS),
+    'undeclared element prefix': (ROOT + b'<ebucore:title>Birds</ebucore:title><x:a>1</x:a><c>2</c>' + END, BIRDS),
+    'undeclared attribute prefix': (ROOT + b'<ebucore:title>Birds</ebucore:title><a x:y="1">1</a><c>2</c>' + END, BIRDS),
+    'undeclared root prefix': (b'<ebucore:ebuCoreMain><a>1</a>' + END, {}),
+    'invalid utf-8': (ROOT + b'<ebucore:title>Bi\xffrds</ebucore:title>' + END, BIRDS),
+    'external entity': (b'<!DOCTYPE r [<!ENTITY e SYSTEM "file:///etc/passwd">]>' + ROOT + b'<a>&e;</a>' + END, {}),
+}
+
+
+def parse(chunk):
+    # Malformed chunks print an error; keep the test output quiet
+    with contextlib.redirect_stdout(io.StringIO()):
+        return wav_to_ale.parse_xml_chunk(chunk, 0, len(chunk))
+
+
+class ParseXMLChunkTest(unittest.TestCase):
+
+    def test_results(self):
+        for name, (chunk, expected) in CASES.items():
+            with self.subTest(name):
+                self.assertEqual(parse(chunk), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
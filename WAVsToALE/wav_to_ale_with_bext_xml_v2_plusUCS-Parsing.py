@@ -27,10 +27,17 @@ __version__ = "1.0.0"
 import os
 import csv
 import wave
-import io
+import hashlib
+import json
+import mmap
+import queue
 import struct
-from xml.etree.ElementTree import iterparse
-from concurrent.futures import ThreadPoolExecutor
+from xml.etree.ElementTree import XMLParser
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import collections
+import functools
+import itertools
+import multiprocessing
 import sys
 import threading
 import subprocess
@@ -39,18 +46,8 @@ try:
     import tkinter as tk
     from tkinter import ttk, filedialog, messagebox, font
     from tkinter.scrolledtext import ScrolledText
-    # Test basic tkinter functionality to ensure it's fully working
-    try:
-        test_root = tk.Tk()
-        test_root.withdraw()  # Hide the test window
-        test_root.destroy()   # Clean up
-    except Exception:
-        # tkinter imported but can't create windows
-        tk = None
-        ttk = None
-        filedialog = None
-        messagebox = None
-        ScrolledText = None
+    # Whether windows can actually be created is checked by _probe_tk(), not at
+    # import: parsing worker processes import this module too
 except Exception as _tk_err:
     # GUI is optional; script still works in CLI mode without tkinter
     tk = None
@@ -70,6 +67,44 @@ except Exception as _tk_err:
     except Exception:
         pass
 
+# Precompiled RIFF chunk header: four-character id, little-endian uint32 size
+_CHUNK_HEADER = struct.Struct('<4sI')
+# fmt chunk: format tag, channels, sample rate, byte rate, block align, bits per sample
+_FMT = struct.Struct('<HHIIHH')
+# The only fmt format tag the wave module accepts
+_WAVE_FORMAT_PCM = 0x0001
+# Chunks that may carry an ebuCore XML document
+_XML_CHUNK_IDS = {b'axml', b'iXML', b'_PMX', b'XML '}
+# Start and end tags of the ebuCore document parse_xml_chunk() reads
+_EBUCORE_ROOT = b'<ebucore:ebuCoreMain'
+_EBUCORE_END = b'</ebucore:ebuCoreMain>'
+# Usual spellings of the .wav extension (anything else falls back to lower())
+_WAV_SUFFIXES = ('.wav', '.WAV', '.Wav')
+# BEXT text fields: description, originator, originator reference, origination date and time
+_BEXT = struct.Struct('<256s32s32s10s8s')
+
+def _tracks_label(channels):
+    """ALE Tracks value for a channel count (A1, A1A2, A1A<n>)."""
+    return "A1" if channels == 1 else "A1A2" if channels == 2 else f"A1A{channels}"
+
+# Tracks values for common channel counts, built once
+_TRACKS = tuple(_tracks_label(c) for c in range(33))
+
+# Skip-log reason appended to the path of AIFF/SD2 files found next to WAVs
+_NONWAV_REASON = "UnsupportedFormat: Non-WAV audio"
+_NONWAV_SKIP = "\t" + _NONWAV_REASON
+
+# Separator line of the skip log summary
+_SKIP_LOG_RULE = "=" * 80 + "\n"
+
+# Fixed start of every ALE Heading section (FPS and the columns follow per file)
+_ALE_HEADING = (
+    "Heading\n"
+    "FIELD_DELIM\tTABS\n"
+    "VIDEO_FORMAT\t1080\n"
+    "AUDIO_FORMAT\t48khz\n"
+)
+
 # Global UCS mapping dictionary
 UCS_MAPPING = {}
 # Collect skipped files/errors for later logging (silently skip during run)
@@ -91,15 +126,16 @@ def load_ucs_mapping(csv_file_path):
     """Load UCS mapping from a CSV file."""
     ucs_mapping = {}
     try:
-        with open(csv_file_path, 'r', encoding='utf-8') as csv_file:
-            reader = csv.DictReader(csv_file)
-            if not reader.fieldnames:
+        with open(csv_file_path, 'r', encoding='utf-8', newline='') as csv_file:
+            reader = csv.reader(csv_file)
+            fieldnames = next(reader, None)
+            if not fieldnames:
                 print("Error: CSV file has no header row.")
                 return {}
 
-            # Build a case-insensitive map of header -> original header
-            headers = [h.strip() for h in reader.fieldnames]
-            lower_map = {h.lower(): h for h in headers}
+            # Build a case-insensitive map of header -> column index
+            headers = [h.strip() for h in fieldnames]
+            lower_map = {h.lower(): i for i, h in enumerate(headers)}
 
             # Required keys (case-insensitive)
             required = ['catid', 'category', 'subcategory']
@@ -107,15 +143,19 @@ def load_ucs_mapping(csv_file_path):
                 print(f"Error: CSV file is missing required columns (CatID, Category, Subcategory). Found headers: {headers}")
                 return {}
 
-            # Use the actual header names when reading rows to preserve original casing
-            catid_h = lower_map['catid']
-            category_h = lower_map['category']
-            subcategory_h = lower_map['subcategory']
+            # Look the columns up once instead of building a dict per row
+            catid_i = lower_map['catid']
+            category_i = lower_map['category']
+            subcategory_i = lower_map['subcategory']
+            width = max(catid_i, category_i, subcategory_i) + 1
 
             for row in reader:
-                cat_id = (row.get(catid_h) or '').strip().upper()
-                category = (row.get(category_h) or 'Unknown').strip()
-                subcategory = (row.get(subcategory_h) or 'Unknown').strip()
+                if len(row) < width:
+                    # Short rows read as blank for the missing columns
+                    row = row + [''] * (width - len(row))
+                cat_id = row[catid_i].strip().upper()
+                category = (row[category_i] or 'Unknown').strip()
+                subcategory = (row[subcategory_i] or 'Unknown').strip()
                 if cat_id:
                     ucs_mapping[cat_id] = (category, subcategory)
     except Exception as e:
@@ -125,191 +165,523 @@ def load_ucs_mapping(csv_file_path):
 def extract_ucs_category(filename):
     """Extract CatID from filename and map to Category and Subcategory."""
     # Assume CatID is the first part of the filename before an underscore
-    cat_id = filename.split('_')[0].upper()
+    cat_id = filename.partition('_')[0]
+    if not cat_id.isupper():
+        cat_id = cat_id.upper()
     category, subcategory = UCS_MAPPING.get(cat_id, ("", ""))  # Return empty strings if CatID is not found
     return category, subcategory
 
-def parse_wav_metadata(wav_file_path, fps: float = 24.0):
+def parse_wav_metadata(wav_file_path, fps: float = 24.0, skip_log: list | None = None):
     """Extract metadata from a WAV file, including BEXT, XML, and INFO chunks.
 
     fps may be a non-integer (e.g. 23.976, 29.97) and is used to compute the
     SMPTE "End" timecode's frame value. The function will round frames and
     carry any overflow into seconds/minutes/hours as needed.
+
+    Skipped files are recorded in skip_log if given, else in the global SKIP_LOG.
     """
+    if skip_log is None:
+        skip_log = SKIP_LOG
     metadata = {}
     try:
-        # Use wave to get audio properties
-        with wave.open(wav_file_path, 'rb') as wf:
-            # Keep full precision for duration (seconds as float)
-            duration = wf.getnframes() / wf.getframerate()
-            # Whole seconds and fractional part
-            whole_seconds = int(duration)
-            frac = duration - whole_seconds
-            # Compute frames with rounding. If frames == fps after rounding,
-            # carry into the whole seconds.
-            frames = int(round(frac * float(fps)))
-            if frames >= int(round(float(fps))):
-                frames = 0
-                whole_seconds += 1
-
-            seconds = whole_seconds % 60
-            minutes = (whole_seconds // 60) % 60
-            hours = whole_seconds // 3600
-            smpte_duration = f"{hours:02}:{minutes:02}:{seconds:02}:{frames:02}"
-
-            channels = wf.getnchannels()
-            tracks = "A1" if channels == 1 else "A1A2" if channels == 2 else f"A1A{channels}"
-
-            metadata.update({
-                "Name": sanitize_string(os.path.basename(wav_file_path)),
-                "Tape": "",
-                "Start": "00:00:00:00",
-                "End": smpte_duration,
-                "Tracks": tracks,
-                "AudioFormat": "WAV",
-                "Filename": sanitize_string(os.path.basename(wav_file_path)),
-                "Channels": channels,
-                "Sample Width": wf.getsampwidth(),
-                "Sample Rate": wf.getframerate(),
-                "Number of Frames": wf.getnframes(),
-                "Duration": duration,
-            })
-
-        # Read raw file bytes so we can locate metadata chunks (bext, XML, INFO)
+        # Open and map the file once and walk its RIFF chunks: audio properties
+        # come from the fmt/data chunk headers and metadata from the bext, XML
+        # and LIST/INFO chunks, without copying the audio into memory
         with open(wav_file_path, 'rb') as f:
-            data = f.read()
-            metadata.update(parse_bext_chunk(data))
-            metadata.update(parse_xml_chunk(data))
-            metadata.update(parse_info_chunk(data))
+            if os.fstat(f.fileno()).st_size < 12:
+                raise EOFError("file too short for a RIFF/WAVE header")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                (channels, sample_rate, sample_width, nframes), chunk_metadata = parse_wav_chunks(data)
+                metadata.update(chunk_metadata)
+
+        # Keep full precision for duration (seconds as float)
+        duration = nframes / sample_rate
+        # Whole seconds and leftover samples in integers, so an exact
+        # duration never lands just below a second boundary
+        whole_seconds, rem_samples = divmod(nframes, sample_rate)
+        # Compute frames with rounding. If frames == fps after rounding,
+        # carry into the whole seconds.
+        frames = int(round(rem_samples * float(fps) / sample_rate))
+        if frames >= int(round(float(fps))):
+            frames = 0
+            whole_seconds += 1
+
+        seconds = whole_seconds % 60
+        minutes = (whole_seconds // 60) % 60
+        hours = whole_seconds // 3600
+        smpte_duration = f"{hours:02}:{minutes:02}:{seconds:02}:{frames:02}"
+
+        tracks = _TRACKS[channels] if channels < len(_TRACKS) else _tracks_label(channels)
 
-        # Extract UCS category from filename
         filename = os.path.basename(wav_file_path)
+        clean_filename = sanitize_string(filename)
+
+        # Audio properties first so the chunk metadata keeps its original precedence
+        metadata = {
+            "Name": clean_filename,
+            "Tape": "",
+            "Start": "00:00:00:00",
+            "End": smpte_duration,
+            "Tracks": tracks,
+            "AudioFormat": "WAV",
+            "Filename": clean_filename,
+            "Channels": channels,
+            "Sample Width": sample_width,
+            "Sample Rate": sample_rate,
+            "Number of Frames": nframes,
+            "Duration": duration,
+            **metadata,
+        }
+
+        # Extract UCS category from filename
         category, subcategory = extract_ucs_category(filename)
         metadata['Category'] = category
         metadata['Subcategory'] = subcategory
 
     except EOFError as e:
         # Record and skip files with EOF or other read errors
-        try:
-            SKIP_LOG.append(f"{wav_file_path}\tEOFError: {e}")
-        except Exception:
-            pass
+        skip_log.append(f"{wav_file_path}\tEOFError: {e}")
         return None
     except wave.Error as e:
         # Record unsupported/unknown WAV formats and skip them silently
-        try:
-            SKIP_LOG.append(f"{wav_file_path}\tWaveError: {e}")
-        except Exception:
-            pass
+        skip_log.append(f"{wav_file_path}\tWaveError: {e}")
         return None
     except Exception as e:
+        skip_log.append(f"{wav_file_path}\tError: {e}")
+        return None
+
+    return metadata
+
+def _init_parse_worker(ucs_mapping):
+    """Process pool initializer: install the parent's UCS mapping in the worker."""
+    global UCS_MAPPING
+    UCS_MAPPING = ucs_mapping
+
+def _parse_wav_worker(wav_file_path, fps):
+    """Parse one WAV in a pool worker.
+
+    Returns (metadata, skip entries); the entries are handed back to the parent
+    because SKIP_LOG is not shared between processes.
+    """
+    skipped = []
+    return parse_wav_metadata(wav_file_path, fps, skip_log=skipped), skipped
+
+def make_parse_executor(use_threads: bool = False):
+    """Create the executor used by parse_wavs.
+
+    A process pool is used when running as the script/app (workers must be able
+    to re-import this module to unpickle _parse_wav_worker), so XML parsing runs
+    on all cores. Threads are used when use_threads is set (better overlap of
+    I/O latency on network storage), when loaded some other way, or where worker
+    processes can't be created.
+    """
+    if __name__ == "__main__" and not use_threads:
+        try:
+            return ProcessPoolExecutor(initializer=_init_parse_worker, initargs=(UCS_MAPPING,))
+        except (OSError, NotImplementedError, ValueError):
+            pass
+    return ThreadPoolExecutor()
+
+def _user_cache_dir():
+    """Per-user folder for WAVsToALE's metadata cache."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+        return os.path.join(base, 'WAVsToALE', 'Cache')
+    if sys.platform == 'darwin':
+        return os.path.expanduser(os.path.join('~', 'Library', 'Caches', 'WAVsToALE'))
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'WAVsToALE')
+
+class MetadataCache:
+    """Parsed WAV metadata from earlier runs, stored as JSON in the user's cache folder.
+
+    There is one cache file per ALE output folder, named after a hash of its
+    path, so nothing is written next to the ALEs. Entries are keyed by absolute
+    path, mtime and size, so edited or replaced files are reparsed. The whole
+    cache is discarded when the context (cache version, FPS, UCS source file)
+    differs from the one it was written with. Only entries used by the current
+    run are written back.
+    """
+
+    VERSION = 1
+
+    def __init__(self, output_dir, fps, ucs_csv_file):
+        digest = hashlib.sha1(os.path.abspath(output_dir).encode('utf-8', 'surrogatepass')).hexdigest()
+        self.path = os.path.join(_user_cache_dir(), digest[:16] + '.json')
         try:
-            SKIP_LOG.append(f"{wav_file_path}\tError: {e}")
+            ucs_stat = os.stat(ucs_csv_file)
+            ucs_source = [os.path.abspath(ucs_csv_file), ucs_stat.st_mtime_ns, ucs_stat.st_size]
+        except (OSError, TypeError):
+            ucs_source = None
+        self.context = {'version': self.VERSION, 'fps': fps, 'ucs': ucs_source}
+        self.entries = {}
+        self.used = {}
+        # Filled by scan_audio_dirs(), so key() needn't stat each file again
+        self.stats = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('context') == self.context:
+                self.entries = cached.get('entries', {})
         except Exception:
+            # Missing or unreadable cache: start empty
             pass
-        return None
 
-    return metadata
+    def key(self, wav_file_path):
+        """Cache key for a file, or None if it can't be stat'ed."""
+        st = self.stats.get(wav_file_path)
+        if st is None:
+            try:
+                st = os.stat(wav_file_path)
+            except OSError:
+                return None
+        return f"{os.path.abspath(wav_file_path)}|{st.st_mtime_ns}|{st.st_size}"
+
+    def get(self, key):
+        """Return a copy of the cached metadata for key, or None."""
+        metadata = self.entries.get(key) if key else None
+        if metadata is None:
+            return None
+        self.used[key] = metadata
+        return dict(metadata)
+
+    def put(self, key, metadata):
+        """Remember a copy of metadata for key."""
+        if key:
+            self.used[key] = dict(metadata)
+
+    def save(self):
+        """Write the entries used by this run (best effort)."""
+        tmp_path = self.path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'context': self.context, 'entries': self.used}, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except Exception:
+                pass
 
-def parse_bext_chunk(data):
-    """Parse the BEXT chunk from the WAV file."""
+# Folders with at most this many files to parse are parsed in the calling thread
+_INLINE_PARSE_MAX = 2
+
+# Number of folders whose files are queued on the pool ahead of the one being written
+_PARSE_LOOKAHEAD = 2
+
+def _submit_wavs(wav_paths, fps, executor, cache):
+    """Queue the uncached files in wav_paths on executor; _collect_wavs() gathers the results."""
+    metadata_list = [None] * len(wav_paths)
+    keys = [None] * len(wav_paths)
+    misses = []
+    for i, path in enumerate(wav_paths):
+        if cache is not None:
+            keys[i] = cache.key(path)
+            metadata_list[i] = cache.get(keys[i])
+        if metadata_list[i] is None:
+            misses.append(i)
+
+    if len(misses) <= _INLINE_PARSE_MAX:
+        # A round trip to the pool costs more than parsing a couple of headers;
+        # map() is lazy, so these are parsed when collected
+        results = map(_parse_wav_worker, [wav_paths[i] for i in misses], itertools.repeat(fps))
+    else:
+        # Batch up to 32 files per pool task to amortize IPC, but keep about four
+        # batches per CPU so small folders still spread across the workers
+        chunksize = max(1, min(32, len(misses) // (4 * (os.cpu_count() or 1))))
+        results = executor.map(_parse_wav_worker, [wav_paths[i] for i in misses],
+                               itertools.repeat(fps), chunksize=chunksize)
+    return metadata_list, keys, misses, results, cache
+
+def _collect_wavs(pending):
+    metadata_list, keys, misses, results, cache = pending
+    for i, (metadata, skipped) in zip(misses, results):
+        metadata_list[i] = metadata
+        SKIP_LOG.extend(skipped)
+        if metadata and not skipped and cache is not None:
+            cache.put(keys[i], metadata)
+    return metadata_list
+
+def parse_wavs(wav_paths, fps, executor, cache: MetadataCache | None = None):
+    """Parse WAV files on executor and return their metadata (None for skipped files) in input order.
+
+    Files found in cache are not reparsed; newly parsed files are added to it.
+    Skip entries are appended to SKIP_LOG in input order.
+    """
+    return _collect_wavs(_submit_wavs(wav_paths, fps, executor, cache))
+
+def iter_parse_wavs(wav_lists, fps, executor, cache: MetadataCache | None = None):
+    """Yield parse_wavs() of each list in wav_lists, in order.
+
+    The files of the next _PARSE_LOOKAHEAD lists are already queued on executor
+    while one is yielded, so the pool keeps working while the caller writes an
+    ALE, and folders smaller than the pool run alongside each other. As with
+    parse_wavs(), skip entries reach SKIP_LOG only when a list's result is taken.
+    """
+    wav_lists = iter(wav_lists)
+    pending = collections.deque(
+        _submit_wavs(wavs, fps, executor, cache)
+        for wavs in itertools.islice(wav_lists, _PARSE_LOOKAHEAD))
+    for wavs in wav_lists:
+        pending.append(_submit_wavs(wavs, fps, executor, cache))
+        yield _collect_wavs(pending.popleft())
+    while pending:
+        yield _collect_wavs(pending.popleft())
+
+def iter_chunks(data):
+    """Yield (chunk_id, data_offset, chunk_size) for the top-level chunks of a RIFF/WAVE buffer.
+
+    Stops at the first truncated chunk header; chunk sizes are not checked
+    against the buffer length.
+    """
+    pos = 12  # skip 'RIFF' <size> 'WAVE'
+    end = len(data)
+    while pos + 8 <= end:
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(data, pos)
+        yield chunk_id, pos + 8, chunk_size
+        # Chunks are word aligned: odd sizes are followed by a pad byte
+        pos += 8 + chunk_size + (chunk_size & 1)
+
+def parse_wav_chunks(data):
+    """Walk the chunks of a RIFF/WAVE buffer once.
+
+    Returns ((channels, sample_rate, sample_width, nframes), metadata) where
+    metadata holds the BEXT, XML and INFO fields (in that order of precedence).
+
+    Raises wave.Error with the same messages as the wave module for files it
+    would reject, so skip-log categories are unchanged.
+    """
+    if data[0:4] != b'RIFF':
+        raise wave.Error('file does not start with RIFF id')
+    if data[8:12] != b'WAVE':
+        raise wave.Error('not a WAVE file')
+    fmt = None
+    nframes = None
+    bext_metadata = None
+    xml_metadata = {}
+    info_metadata = {}
+    # Keep walking after 'data': LIST/INFO and XML chunks are often written after the audio
+    for chunk_id, offset, size in iter_chunks(data):
+        if chunk_id == b'fmt ':
+            if size < 16 or offset + 16 > len(data):
+                raise EOFError("fmt chunk is truncated")
+            format_tag, channels, sample_rate, _, _, bits_per_sample = _FMT.unpack_from(data, offset)
+            if format_tag != _WAVE_FORMAT_PCM:
+                raise wave.Error(f'unknown format: {format_tag}')
+            if not channels:
+                raise wave.Error('bad # of channels')
+            sample_width = (bits_per_sample + 7) // 8
+            if not sample_width:
+                raise wave.Error('bad sample width')
+            fmt = (channels, sample_rate, sample_width)
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise wave.Error('data chunk before fmt chunk')
+            if nframes is None:
+                nframes = size // (fmt[0] * fmt[2])
+        elif chunk_id == b'bext':
+            if bext_metadata is None:
+                bext_metadata = parse_bext_chunk(data, offset, size)
+        elif chunk_id == b'LIST':
+            if data[offset:offset + 4] == b'INFO':
+                info_metadata.update(parse_info_chunk(data, offset + 4, size - 4))
+        elif chunk_id in _XML_CHUNK_IDS:
+            xml_metadata.update(parse_xml_chunk(data, offset, size))
+    if fmt is None or nframes is None:
+        raise wave.Error('fmt chunk and/or data chunk missing')
+
+    metadata = dict(bext_metadata or {})
+    metadata.update(xml_metadata)
+    metadata.update(info_metadata)
+    return fmt + (nframes,), metadata
+
+def parse_bext_chunk(data, start, size):
+    """Parse the BEXT chunk body at data[start:start + size]."""
     bext_metadata = {}
     try:
-        bext_start = data.find(b'bext')
-        if bext_start != -1:
-            # Skip the 'bext' identifier and chunk size (8 bytes total)
-            bext_start += 8
-            # Extract fields from the BEXT chunk (fixed sizes)
-            description = sanitize_string(data[bext_start:bext_start + 256].decode('ascii', errors='ignore'))
-            originator = sanitize_string(data[bext_start + 256:bext_start + 256 + 32].decode('ascii', errors='ignore'))
-            originator_ref = sanitize_string(data[bext_start + 288:bext_start + 288 + 32].decode('ascii', errors='ignore'))
-            origination_date = sanitize_string(data[bext_start + 320:bext_start + 320 + 10].decode('ascii', errors='ignore'))
-            origination_time = sanitize_string(data[bext_start + 330:bext_start + 330 + 8].decode('ascii', errors='ignore'))
-
-            bext_metadata.update({
-                'Description': description,
-                'Originator': originator,
-                'Originator Reference': originator_ref,
-                'Origination Date': origination_date,
-                'Origination Time': origination_time,
-            })
+        # Extract fields from the BEXT chunk (fixed sizes) in place; the coding
+        # history after them is never copied. A short chunk is NUL-padded,
+        # which sanitize_bytes() drops again.
+        if min(size, len(data) - start) < _BEXT.size:
+            data = data[start:start + size].ljust(_BEXT.size, b'\x00')
+            start = 0
+        description, originator, originator_ref, origination_date, origination_time = (
+            _sanitize_field(field) for field in _BEXT.unpack_from(data, start))
+
+        bext_metadata.update({
+            'Description': description,
+            'Originator': originator,
+            'Originator Reference': originator_ref,
+            'Origination Date': origination_date,
+            'Origination Time': origination_time,
+        })
     except Exception as e:
         print(f"Error parsing BEXT chunk: {e}")
     return bext_metadata
 
-def parse_xml_chunk(data):
-    """Parse the XML chunk from the WAV file."""
+class _XMLTextCollector:
+    """XMLParser target that records each element's text, keyed by local tag name.
+
+    Mirrors what an Element's .text would hold (the text before its first
+    child) and stores it when the element ends, so later elements win for
+    repeated tags, as with iterparse.
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self._stack = []   # [tag, text parts] per open element
+        self._parts = None  # text parts of the innermost element, until its first child starts
+
+    def start(self, tag, attrs):
+        self._parts = []
+        self._stack.append((tag, self._parts))
+
+    def data(self, text):
+        if self._parts is not None:
+            self._parts.append(text)
+
+    def end(self, tag):
+        tag, parts = self._stack.pop()
+        self._parts = None
+        text = ''.join(parts)
+        if text:
+            self.out[tag.rpartition('}')[2]] = sanitize_string(text.strip())
+
+    def close(self):
+        return self.out
+
+def parse_xml_chunk(data, start, size):
+    """Parse the ebuCore document in the XML chunk body (axml, iXML, ...) at data[start:start + size]."""
     xml_metadata = {}
     try:
-        xml_start = data.find(b'<ebucore:ebuCoreMain')
+        # Search in place: most iXML chunks carry no ebuCore document at all
+        end = min(start + size, len(data))
+        xml_start = data.find(_EBUCORE_ROOT, start, end)
         if xml_start != -1:
-            xml_end = data.find(b'</ebucore:ebuCoreMain>') + len(b'</ebucore:ebuCoreMain>')
-            xml_data = data[xml_start:xml_end].decode('utf-8', errors='ignore')
-
-            # Parse XML data
-            for event, elem in iterparse(io.StringIO(xml_data), events=("start", "end")):
-                if event == "end" and elem.text:
-                    tag = elem.tag.split('}')[-1]  # Remove namespace
-                    xml_metadata[tag] = sanitize_string(elem.text.strip())
+            # Without a closing tag, hand the parser the rest of the chunk
+            xml_end = data.find(_EBUCORE_END, xml_start, end)
+            xml_end = end if xml_end == -1 else xml_end + len(_EBUCORE_END)
+
+            # Collect {tag: text} straight from the parser callbacks, without building elements
+            parser = XMLParser(target=_XMLTextCollector(xml_metadata))
+            parser.feed(data[xml_start:xml_end].decode('utf-8', errors='ignore'))
+            parser.close()
     except Exception as e:
         print(f"Error parsing XML chunk: {e}")
     return xml_metadata
 
-def parse_info_chunk(data):
-    """Parse the INFO chunk from the WAV file."""
+def parse_info_chunk(data, start, size):
+    """Parse the subchunks of a LIST/INFO chunk at data[start:start + size] (after the 'INFO' type)."""
     info_metadata = {}
     try:
-        offset = 0
-        while True:
-            info_start = data.find(b'LIST', offset)
-            if info_start == -1:
-                break
-            # Read LIST chunk size (4 bytes little-endian)
-            if info_start + 8 > len(data):
+        end = min(start + size, len(data))
+        sub_offset = start
+        while sub_offset + 8 <= end:
+            chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(data, sub_offset)
+            data_start = sub_offset + 8
+            data_end = data_start + chunk_size
+            if data_end > end:
                 break
-            list_size = struct.unpack('<I', data[info_start + 4:info_start + 8])[0]
-            list_type = data[info_start + 8:info_start + 12]
-            # We only care about INFO lists
-            if list_type == b'INFO':
-                # Start of INFO subchunks
-                sub_offset = info_start + 12
-                end_of_list = info_start + 8 + list_size
-                while sub_offset + 8 <= end_of_list and sub_offset + 8 <= len(data):
-                    chunk_id = data[sub_offset:sub_offset + 4]
-                    chunk_size = struct.unpack('<I', data[sub_offset + 4:sub_offset + 8])[0]
-                    data_start = sub_offset + 8
-                    data_end = data_start + chunk_size
-                    if data_end > len(data):
-                        break
-                    chunk_data = data[data_start:data_end].split(b'\x00')[0].decode('utf-8', errors='ignore').strip()
-                    try:
-                        info_metadata[chunk_id.decode('ascii')] = sanitize_string(chunk_data)
-                    except Exception:
-                        info_metadata[str(chunk_id)] = sanitize_string(chunk_data)
-                    # Chunks are word aligned: if chunk_size is odd, there's a pad byte
-                    pad = 1 if (chunk_size % 2) == 1 else 0
-                    sub_offset = data_end + pad
-            # Move forward to look for another LIST
-            offset = info_start + 4
+            # Values end at the first NUL; find it in place so padding is never copied
+            nul = data.find(b'\x00', data_start, data_end)
+            chunk_data = _sanitize_field(data[data_start:data_end if nul == -1 else nul])
+            try:
+                info_metadata[chunk_id.decode('ascii')] = chunk_data
+            except Exception:
+                info_metadata[str(chunk_id)] = chunk_data
+            # Chunks are word aligned: if chunk_size is odd, there's a pad byte
+            pad = 1 if (chunk_size % 2) == 1 else 0
+            sub_offset = data_end + pad
     except Exception as e:
         print(f"Error parsing INFO chunk: {e}")
     return info_metadata
 
+def scan_audio_dirs(root, nonwav_exts=(), stats=None):
+    """Group WAV and other audio files under root by directory.
+
+    Returns (dir_wav_map, dir_nonwav_map), each mapping a directory path to its
+    files in directory order. Like os.walk, symlinked directories are listed but
+    not followed. os.scandir gives each entry's type from the directory read,
+    so no extra stat is needed per file. If stats is given, it is filled with
+    each WAV's stat result (free on Windows, where the directory read has it).
+    """
+    dir_wav_map = {}
+    dir_nonwav_map = {}
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        wavs = []
+        nonwavs = []
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    name = entry.name
+                    # Common spellings skip the splitext/lower() copies; the length
+                    # check keeps splitext's rule that a dotfile like ".wav" has no extension
+                    if name.endswith(_WAV_SUFFIXES) and len(name.lstrip('.')) > 4:
+                        ext = '.wav'
+                    else:
+                        ext = os.path.splitext(name)[1].lower()
+                    if ext == '.wav':
+                        wavs.append(entry.path)
+                        if stats is not None:
+                            try:
+                                stats[entry.path] = entry.stat()
+                            except OSError:
+                                pass
+                    elif ext in nonwav_exts:
+                        nonwavs.append(entry.path)
+        except OSError:
+            # Unreadable directory: skip it, as os.walk does
+            continue
+        if wavs:
+            dir_wav_map[dirpath] = wavs
+        if nonwavs:
+            dir_nonwav_map[dirpath] = nonwavs
+        # Visit subdirectories in listing order (top-down, like os.walk)
+        stack.extend(reversed(subdirs))
+    return dir_wav_map, dir_nonwav_map
+
 def sanitize_string(value):
     """Remove null bytes, non-printable characters, tabs, newlines, and non-ASCII characters for strict ALE compatibility."""
     if value:
-        # Replace tabs, newlines, and carriage returns with spaces first
-        cleaned = value.replace('\t', ' ').replace('\n', ' ').replace('\r', ' ')
-        # Remove non-printable characters
-        cleaned = ''.join(char for char in cleaned if char.isprintable())
-        # Remove non-ASCII characters for strict ALE compatibility (only allow ASCII 0-127)
-        cleaned = ''.join(char for char in cleaned if ord(char) < 128)
-        # Collapse multiple spaces into single space and strip
-        cleaned = ' '.join(cleaned.split())
-        return cleaned
+        if value.isascii() and value.isprintable():
+            # Already clean (the usual case): only spaces can need collapsing
+            if '  ' in value or value[0] == ' ' or value[-1] == ' ':
+                return ' '.join(value.split())
+            return value
+        # Remove non-ASCII characters for strict ALE compatibility (only allow ASCII 0-127);
+        # sanitize_bytes() then does the rest with one translate pass
+        return sanitize_bytes(value.encode('ascii', errors='ignore'))
     return ""
 
 
+# Translate table for sanitize_bytes(): tabs, newlines and carriage returns
+# become spaces; other non-printable and non-ASCII bytes are deleted.
+_SANITIZE_TABLE = bytes.maketrans(b'\t\n\r', b'   ')
+_SANITIZE_DELETE = bytes(c for c in range(256) if (c < 0x20 and c not in b'\t\n\r') or c > 0x7E)
+
+def sanitize_bytes(raw):
+    """sanitize_string() for a raw ASCII field, without decoding the padding first."""
+    cleaned = raw.translate(_SANITIZE_TABLE, _SANITIZE_DELETE)
+    # Collapse multiple spaces into single space and strip
+    return ' '.join(cleaned.decode('ascii').split()) if cleaned else ""
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_field(raw):
+    """sanitize_bytes() memoized for BEXT/INFO values, which repeat across a library (originator, dates, ...)."""
+    return sanitize_bytes(raw)
+
 def sanitize_path(path_str):
     """Normalize a path string coming from user input.
 
@@ -373,46 +745,37 @@ def create_ale_file(metadata_list, output_file_path, fps=24):
     # Note: "Color" column must come before "Name" per Avid ALE spec
     required_columns = ["Color", "Name", "Tape", "Start", "End", "Tracks", "AudioFormat"]
 
-    # Collect all unique metadata keys from the metadata list
-    all_columns = set(required_columns)
-    for metadata in metadata_list:
-        all_columns.update(metadata.keys())
-
     # Exclude unwanted internal columns
     excluded_columns = {"Origination Date", "Origination Time", "Sample Width", "Duration", "Channels"}
-    all_columns = [col for col in all_columns if col not in excluded_columns]
 
-    # Ensure required columns are first and in order
-    all_columns = list(required_columns) + [col for col in sorted(all_columns) if col not in required_columns]
+    # Collect all unique metadata keys in one set union, minus excluded and required ones
+    extra_columns = set().union(*metadata_list)
+    extra_columns.difference_update(excluded_columns, required_columns)
 
-    # Ensure all metadata entries have every column
-    for metadata in metadata_list:
-        for column in all_columns:
-            if column not in metadata:
-                metadata[column] = ""
+    # Required columns first and in order, then the rest sorted by name
+    all_columns = required_columns + sorted(extra_columns)
 
     # Write ALE with a conventional Heading/Column/Data structure
     try:
         tmp_path = output_file_path + '.tmp'
-        with open(tmp_path, 'w', newline='', encoding='utf-8') as ale_file:
-            ale_file.write("Heading\n")
-            ale_file.write("FIELD_DELIM\tTABS\n")
-            ale_file.write("VIDEO_FORMAT\t1080\n")
-            ale_file.write("AUDIO_FORMAT\t48khz\n")
-            ale_file.write(f"FPS\t{fps}\n")
-            ale_file.write("\n")
-            ale_file.write("Column\n")
-            ale_file.write("\t".join(all_columns) + "\n")
-            ale_file.write("\n")
-            ale_file.write("Data\n")
-
-            # Filter out any metadata entries that are empty (all columns blank/whitespace)
-            for metadata in metadata_list:
-                values = [str(metadata.get(column, "")).strip() for column in all_columns]
-                if not any(values):
-                    # skip entirely blank rows
-                    continue
-                ale_file.write("\t".join(values) + "\n")
+        with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as ale_file:
+            ale_file.write(
+                _ALE_HEADING +
+                f"FPS\t{fps}\n"
+                "\n"
+                "Column\n"
+                + "\t".join(all_columns) + "\n"
+                "\n"
+                "Data\n"
+            )
+
+            # Columns an entry lacks are written blank; entries that are empty
+            # (all columns blank) are skipped. Text values were sanitized (and so
+            # stripped) when parsed; str() only formats the numeric fields.
+            blanks = itertools.repeat("")
+            rows = (list(map(str, map(metadata.get, all_columns, blanks)))
+                    for metadata in metadata_list)
+            ale_file.writelines("\t".join(values) + "\n" for values in rows if any(values))
 
         # Atomic replace
         try:
@@ -432,7 +795,66 @@ def create_ale_file(metadata_list, output_file_path, fps=24):
         print(f"Error creating ALE file: {e}")
         return None
 
-def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print, cancel_event: threading.Event | None = None, output_paths: list | None = None):
+def format_skip_log(total_processed, total_successful, skipped_entries, error_counts=None):
+    """Build the text of a .skip.log file: a summary block followed by every skip entry.
+
+    error_counts defaults to a count of the entries by error type (the text
+    between the tab and the first colon).
+    """
+    if error_counts is None:
+        error_counts = collections.Counter(
+            entry.partition('\t')[2].partition(':')[0] for entry in skipped_entries if '\t' in entry)
+    parts = [
+        _SKIP_LOG_RULE, "SKIP LOG SUMMARY\n", _SKIP_LOG_RULE,
+        f"Total files processed: {total_processed}\n",
+        f"Successfully parsed: {total_successful}\n",
+        f"Skipped (errors): {len(skipped_entries)}\n",
+        "\n",
+    ]
+    if error_counts:
+        parts.append("Errors by type:\n")
+        parts.extend(f"  {error_type}: {count}\n" for error_type, count in sorted(error_counts.items()))
+    parts += [_SKIP_LOG_RULE, "\n", "DETAILED ERROR LOG\n", "-" * 80 + "\n"]
+    parts.extend(line + '\n' for line in skipped_entries)
+    return ''.join(parts)
+
+def write_skip_log(skip_log_path, text):
+    """Write a skip log in one call.
+
+    A new log is created in place with O_EXCL; one left by an earlier run is
+    replaced atomically via a temporary file.
+    """
+    try:
+        fd = os.open(skip_log_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        pass
+    else:
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except Exception:
+            # Don't leave a truncated log behind
+            try:
+                os.remove(skip_log_path)
+            except Exception:
+                pass
+            raise
+        return
+
+    tmp_path = skip_log_path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, skip_log_path)
+    except Exception:
+        # Best-effort cleanup
+        try:
+            os.remove(tmp_path)
+        except Exception:
+            pass
+        raise
+
+def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print, cancel_event: threading.Event | None = None, output_paths: list | None = None, use_threads: bool = False):
     """Run the conversion using existing logic without interactive prompts.
 
     Parameters:
@@ -442,6 +864,7 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
     - fps: Integer FPS for ALE header.
     - logger: Function to consume log strings (defaults to print). GUI can pass a custom logger.
     - output_paths: Optional list to collect actual ALE file paths created (for GUI tracking).
+    - use_threads: Parse with a thread pool instead of worker processes (e.g. for network volumes).
     """
     global UCS_MAPPING
     
@@ -490,7 +913,8 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
         logger("Error: No WAV file or directory provided.")
         return False
     is_single_file = os.path.isfile(wav_path)
-    is_directory = os.path.isdir(wav_path)
+    # A regular file can't be a directory too: skip the second stat
+    is_directory = not is_single_file and os.path.isdir(wav_path)
     if not is_single_file and not is_directory:
         logger(f"Error: Path does not exist or is not a file/directory: {wav_path}")
         return False
@@ -543,38 +967,11 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
             # Write a skip log for single-file failures so issues are recorded on disk
             try:
                 skip_log_path = output_ale_file + '.skip.log'
-                total_processed = 1
-                total_successful = 0
-                total_skipped = 1
-                # Count errors by type from the last SKIP_LOG entry if available
-                error_counts = {}
-                if SKIP_LOG:
-                    last = SKIP_LOG[-1]
-                    if '\t' in last:
-                        error_type = last.split('\t', 1)[1].split(':')[0]
-                        error_counts[error_type] = error_counts.get(error_type, 0) + 1
-                with open(skip_log_path, 'w', encoding='utf-8') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write("SKIP LOG SUMMARY\n")
-                    f.write("=" * 80 + "\n")
-                    f.write(f"Total files processed: {total_processed}\n")
-                    f.write(f"Successfully parsed: {total_successful}\n")
-                    f.write(f"Skipped (errors): {total_skipped}\n")
-                    f.write("\n")
-                    if error_counts:
-                        f.write("Errors by type:\n")
-                        for error_type, count in sorted(error_counts.items()):
-                            f.write(f"  {error_type}: {count}\n")
-                    f.write("=" * 80 + "\n\n")
-                    f.write("DETAILED ERROR LOG\n")
-                    f.write("-" * 80 + "\n")
-                    if SKIP_LOG:
-                        f.write(SKIP_LOG[-1] + '\n')
-                    else:
-                        f.write(f"{wav_path}\tError: Unknown parse failure\n")
+                skipped_entries = SKIP_LOG[-1:] or [f"{wav_path}\tError: Unknown parse failure"]
+                write_skip_log(skip_log_path, format_skip_log(1, 0, skipped_entries))
                 logger(f"Wrote skip log: {skip_log_path}")
-            except Exception:
-                pass
+            except Exception as e:
+                logger(f"Could not write skip log {skip_log_path}: {e}")
             return False
 
     # Directory case
@@ -584,10 +981,9 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
     explicit_output_requested = bool(output_ale_file)
     
     # Resolve output path/root before scanning so we can emit logs even if no WAVs are found
-    wav_basename = os.path.basename(os.path.normpath(wav_directory))
+    wav_parent, wav_basename = os.path.split(os.path.normpath(wav_directory))
     if not output_ale_file:
         # Default: place outputs next to WAV directory under an 'ALEs/<basename>' folder
-        wav_parent = os.path.dirname(os.path.normpath(wav_directory))
         ales_dir = os.path.join(wav_parent, 'ALEs')
         try:
             os.makedirs(ales_dir, exist_ok=True)
@@ -613,24 +1009,10 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
     except Exception:
         pass
 
+    cache = MetadataCache(ales_output_root, fps, ucs_csv_file)
+
     # Build directory maps for WAVs and non-WAV audio files to improve skip logging
-    dir_wav_map = {}
-    dir_nonwav_map = {}
-    nonwav_exts = {'.aiff', '.aif', '.sd2'}
-    for dirpath, dirnames, filenames in os.walk(wav_directory):
-        wavs = []
-        nonwavs = []
-        for f in filenames:
-            p = os.path.join(dirpath, f)
-            ext = os.path.splitext(f)[1].lower()
-            if ext == '.wav':
-                wavs.append(p)
-            elif ext in nonwav_exts:
-                nonwavs.append(p)
-        if wavs:
-            dir_wav_map[dirpath] = wavs
-        if nonwavs:
-            dir_nonwav_map[dirpath] = nonwavs
+    dir_wav_map, dir_nonwav_map = scan_audio_dirs(wav_directory, {'.aiff', '.aif', '.sd2'}, cache.stats)
 
     # If no WAVs found anywhere, optionally write a summary skip log for detected non-WAV audio
     if not dir_wav_map:
@@ -639,31 +1021,13 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
             try:
                 out_file = os.path.join(ales_output_root, f"{wav_basename}.ale")
                 skip_log_path = out_file + '.skip.log'
-                tmp_path = skip_log_path + '.tmp'
-                with open(tmp_path, 'w', encoding='utf-8') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write("SKIP LOG SUMMARY\n")
-                    f.write("=" * 80 + "\n")
-                    f.write("Total files processed: 0\n")
-                    f.write("Successfully parsed: 0\n")
-                    f.write(f"Skipped (errors): {total_nonwavs}\n")
-                    f.write("\nErrors by type:\n  UnsupportedFormat: Non-WAV audio: {0}\n".format(total_nonwavs))
-                    f.write("=" * 80 + "\n\n")
-                    f.write("DETAILED ERROR LOG\n")
-                    f.write("-" * 80 + "\n")
-                    for dirpath, files in sorted(dir_nonwav_map.items()):
-                        for p in files:
-                            f.write(f"{p}\tUnsupportedFormat: Non-WAV audio\n")
-                try:
-                    os.replace(tmp_path, skip_log_path)
-                except Exception:
-                    try:
-                        os.remove(tmp_path)
-                    except Exception:
-                        pass
+                skipped_entries = [p + _NONWAV_SKIP
+                                   for _, files in sorted(dir_nonwav_map.items()) for p in files]
+                write_skip_log(skip_log_path, format_skip_log(
+                    0, 0, skipped_entries, {_NONWAV_REASON: total_nonwavs}))
                 logger(f"Wrote skip log: {skip_log_path}")
-            except Exception:
-                pass
+            except Exception as e:
+                logger(f"Could not write skip log {skip_log_path}: {e}")
         logger(f"Error: No WAV files found in the directory '{wav_directory}'.")
         return False
 
@@ -674,21 +1038,18 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
         if cancel_event is not None and cancel_event.is_set():
             logger("Cancelled before processing top-level WAVs.")
             return False
-        top_level_wavs = [p for p in dir_wav_map.get(wav_directory, [])]
+        top_level_wavs = dir_wav_map.get(wav_directory, ())
         if not top_level_wavs:
             logger(f"Error: No WAV files found in the directory '{wav_directory}'.")
             return False
         logger(f"Creating single ALE for top-level WAVs in: {wav_directory}")
         start_len = len(SKIP_LOG)
         # Record any top-level non-WAV audio as skipped
-        for p in dir_nonwav_map.get(wav_directory, []):
-            try:
-                SKIP_LOG.append(f"{p}\tUnsupportedFormat: Non-WAV audio")
-            except Exception:
-                pass
-        with ThreadPoolExecutor() as executor:
+        SKIP_LOG.extend(p + _NONWAV_SKIP for p in dir_nonwav_map.get(wav_directory, ()))
+        with make_parse_executor(use_threads) as executor:
             # Pass fps through to parsing so SMPTE frame calc is accurate for non-integer rates
-            metadata_list = list(executor.map(lambda p: parse_wav_metadata(p, fps), top_level_wavs))
+            metadata_list = parse_wavs(top_level_wavs, fps, executor, cache)
+        cache.save()
         metadata_list = [m for m in metadata_list if m]
         if metadata_list:
             actual_path = create_ale_file(metadata_list, output_ale_file, fps)
@@ -702,42 +1063,10 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
             try:
                 skip_log_path = output_ale_file + '.skip.log'
                 skipped_entries = SKIP_LOG[start_len:]
-                total_processed = len(top_level_wavs)
-                total_skipped = len(skipped_entries)
-                total_successful = len(metadata_list)
-                error_counts = {}
-                for entry in skipped_entries:
-                    if '\t' in entry:
-                        error_type = entry.split('\t', 1)[1].split(':')[0]
-                        error_counts[error_type] = error_counts.get(error_type, 0) + 1
-                tmp_path = skip_log_path + '.tmp'
-                with open(tmp_path, 'w', encoding='utf-8') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write("SKIP LOG SUMMARY\n")
-                    f.write("=" * 80 + "\n")
-                    f.write(f"Total files processed: {total_processed}\n")
-                    f.write(f"Successfully parsed: {total_successful}\n")
-                    f.write(f"Skipped (errors): {total_skipped}\n")
-                    f.write("\n")
-                    if error_counts:
-                        f.write("Errors by type:\n")
-                        for error_type, count in sorted(error_counts.items()):
-                            f.write(f"  {error_type}: {count}\n")
-                    f.write("=" * 80 + "\n\n")
-                    f.write("DETAILED ERROR LOG\n")
-                    f.write("-" * 80 + "\n")
-                    for line in skipped_entries:
-                        f.write(line + '\n')
-                try:
-                    os.replace(tmp_path, skip_log_path)
-                except Exception:
-                    try:
-                        os.remove(tmp_path)
-                    except Exception:
-                        pass
+                write_skip_log(skip_log_path, format_skip_log(len(top_level_wavs), len(metadata_list), skipped_entries))
                 logger(f"Wrote skip log: {skip_log_path}")
-            except Exception:
-                pass
+            except Exception as e:
+                logger(f"Could not write skip log {skip_log_path}: {e}")
         if metadata_list:
             logger(f"Successfully created ALE file: {output_ale_file}")
             return True
@@ -748,82 +1077,77 @@ def run_conversion(ucs_csv_file, wav_path, output_ale_file, fps=24, logger=print
     # Per-subdirectory ALEs
     logger("Creating ALEs per subdirectory…")
     cancelled_mid_run = False
-    for dirpath, wavs in sorted(dir_wav_map.items()):
-        if cancel_event is not None and cancel_event.is_set():
-            logger("Cancelled. Stopping before next subdirectory.")
-            cancelled_mid_run = True
-            break
-        rel = os.path.relpath(dirpath, wav_directory)
-        target_dir = ales_output_root if rel == '.' else os.path.join(ales_output_root, rel)
-        try:
-            os.makedirs(target_dir, exist_ok=True)
-        except Exception:
-            pass
-        out_file = os.path.join(target_dir, f"{os.path.basename(dirpath)}.ale")
-        start_len = len(SKIP_LOG)
-        # Record any non-WAV audio in this directory as skipped
-        for p in dir_nonwav_map.get(dirpath, []):
+    dir_items = sorted(dir_wav_map.items())
+    # scan_audio_dirs() builds every subdirectory path by appending to the root,
+    # so the relative part is a plain slice (os.path.relpath would abspath both)
+    root_prefix = os.path.join(wav_directory, '')
+    with make_parse_executor(use_threads) as executor:
+        parsed = iter_parse_wavs((wavs for _, wavs in dir_items), fps, executor, cache)
+        for dirpath, wavs in dir_items:
+            if cancel_event is not None and cancel_event.is_set():
+                logger("Cancelled. Stopping before next subdirectory.")
+                cancelled_mid_run = True
+                # Drop the folders already queued ahead of this one
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+            rel = '.' if dirpath == wav_directory else dirpath[len(root_prefix):]
+            target_dir = ales_output_root if rel == '.' else os.path.join(ales_output_root, rel)
             try:
-                SKIP_LOG.append(f"{p}\tUnsupportedFormat: Non-WAV audio")
+                os.makedirs(target_dir, exist_ok=True)
             except Exception:
                 pass
-        with ThreadPoolExecutor() as executor:
-            metadata_list = list(executor.map(lambda p: parse_wav_metadata(p, fps), wavs))
-        metadata_list = [m for m in metadata_list if m]
-        if metadata_list:
-            actual_path = create_ale_file(metadata_list, out_file, fps)
-            if actual_path:
-                if output_paths is not None:
-                    output_paths.append(actual_path)
-                logger(f"Wrote ALE: {actual_path}")
-        # Write skip log if any entries were added (including non-WAVs or parse failures),
-        # even if we didn't produce an ALE file for this directory
-        if len(SKIP_LOG) > start_len:
-            try:
-                skip_log_path = out_file + '.skip.log'
-                skipped_entries = SKIP_LOG[start_len:]
-                total_processed = len(wavs)
-                total_skipped = len(skipped_entries)
-                total_successful = len(metadata_list)
-                error_counts = {}
-                for entry in skipped_entries:
-                    if '\t' in entry:
-                        error_type = entry.split('\t', 1)[1].split(':')[0]
-                        error_counts[error_type] = error_counts.get(error_type, 0) + 1
-                tmp_path = skip_log_path + '.tmp'
-                with open(tmp_path, 'w', encoding='utf-8') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write("SKIP LOG SUMMARY\n")
-                    f.write("=" * 80 + "\n")
-                    f.write(f"Total files processed: {total_processed}\n")
-                    f.write(f"Successfully parsed: {total_successful}\n")
-                    f.write(f"Skipped (errors): {total_skipped}\n")
-                    f.write("\n")
-                    if error_counts:
-                        f.write("Errors by type:\n")
-                        for error_type, count in sorted(error_counts.items()):
-                            f.write(f"  {error_type}: {count}\n")
-                    f.write("=" * 80 + "\n\n")
-                    f.write("DETAILED ERROR LOG\n")
-                    f.write("-" * 80 + "\n")
-                    for line in skipped_entries:
-                        f.write(line + '\n')
+            out_file = os.path.join(target_dir, f"{os.path.basename(dirpath)}.ale")
+            start_len = len(SKIP_LOG)
+            # Record any non-WAV audio in this directory as skipped
+            SKIP_LOG.extend(p + _NONWAV_SKIP for p in dir_nonwav_map.get(dirpath, ()))
+            metadata_list = next(parsed)
+            metadata_list = [m for m in metadata_list if m]
+            if metadata_list:
+                actual_path = create_ale_file(metadata_list, out_file, fps)
+                if actual_path:
+                    if output_paths is not None:
+                        output_paths.append(actual_path)
+                    logger(f"Wrote ALE: {actual_path}")
+            # Write skip log if any entries were added (including non-WAVs or parse failures),
+            # even if we didn't produce an ALE file for this directory
+            if len(SKIP_LOG) > start_len:
                 try:
-                    os.replace(tmp_path, skip_log_path)
-                except Exception:
-                    try:
-                        os.remove(tmp_path)
-                    except Exception:
-                        pass
-                logger(f"Wrote skip log: {skip_log_path}")
-            except Exception:
-                pass
+                    skip_log_path = out_file + '.skip.log'
+                    skipped_entries = SKIP_LOG[start_len:]
+                    write_skip_log(skip_log_path, format_skip_log(len(wavs), len(metadata_list), skipped_entries))
+                    logger(f"Wrote skip log: {skip_log_path}")
+                except Exception as e:
+                    logger(f"Could not write skip log {skip_log_path}: {e}")
+    cache.save()
     if cancelled_mid_run:
         logger("Cancelled. Some ALEs may have been created before stopping.")
         return False
     logger("Done.")
     return True
 
+def _probe_tk():
+    """Check that tkinter can create a window; if it can't, disable the GUI (tk = None).
+
+    Called from the main block after freeze_support(), so frozen worker
+    processes never reach it and don't each create a Tk root (an extra
+    Dock icon per worker on macOS).
+    """
+    global tk, ttk, filedialog, messagebox, ScrolledText
+    if tk is None:
+        return
+    # Test basic tkinter functionality to ensure it's fully working
+    try:
+        test_root = tk.Tk()
+        test_root.withdraw()  # Hide the test window
+        test_root.destroy()   # Clean up
+    except Exception:
+        # tkinter imported but can't create windows
+        tk = None
+        ttk = None
+        filedialog = None
+        messagebox = None
+        ScrolledText = None
+
 def launch_gui():
     """Launch a minimal Tkinter GUI for selecting inputs and running conversion."""
     if tk is None:
@@ -841,33 +1165,51 @@ def launch_gui():
     last_outputs = { 'paths': [] }
     cancel_event = threading.Event()
 
+    # Log lines that name a generated ALE; they enable the Reveal button
+    output_markers = ("Successfully created ALE file for single WAV:", "Successfully created ALE file:", "Wrote ALE:")
+    log_queue = queue.SimpleQueue()
+
     def log(msg):
+        # Called from the worker thread too: only queue the line here, the Tk
+        # thread inserts it on the next flush_log()
+        log_queue.put(str(msg))
+
+    def flush_log():
+        lines = []
+        try:
+            while True:
+                lines.append(log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not lines:
+            return
         log_text.configure(state='normal')
-        log_text.insert('end', str(msg) + "\n")
+        log_text.insert('end', "\n".join(lines) + "\n")
         log_text.see('end')
         log_text.configure(state='disabled')
         # Capture generated ALE paths from log lines to enable Reveal button
-        try:
-            s = str(msg)
-            markers = ["Successfully created ALE file for single WAV:", "Successfully created ALE file:", "Wrote ALE:"]
-            for m in markers:
-                if s.startswith(m):
-                    path = s.split(m, 1)[1].strip()
-                    if path:
-                        # If it ends with '.ale', store it; otherwise ignore
-                        if path.lower().endswith('.ale'):
-                            if path not in last_outputs['paths']:
-                                last_outputs['paths'].append(path)
-                            try:
-                                # Show and enable the button when first output appears
-                                if not open_btn.winfo_ismapped():
-                                    open_btn.pack(side='left', padx=(8,0))
-                                open_btn.configure(state='normal')
-                            except Exception:
-                                pass
-                    break
-        except Exception:
-            pass
+        for s in lines:
+            try:
+                if s.startswith(output_markers):
+                    path = s.split(':', 1)[1].strip()
+                    # If it ends with '.ale', store it; otherwise ignore
+                    if path.lower().endswith('.ale'):
+                        if path not in last_outputs['paths']:
+                            last_outputs['paths'].append(path)
+                        try:
+                            # Show and enable the button when first output appears
+                            if not open_btn.winfo_ismapped():
+                                open_btn.pack(side='left', padx=(8,0))
+                            open_btn.configure(state='normal')
+                        except Exception:
+                            pass
+            except Exception:
+                pass
+
+    def poll_log():
+        # One Text update per interval however many lines arrived
+        flush_log()
+        root.after(50, poll_log)
 
     def browse_wav_file():
         path = filedialog.askopenfilename(title="Select WAV file",
@@ -914,6 +1256,7 @@ def launch_gui():
             ok = run_conversion(None, wavp, outp, fps=fps, logger=log, cancel_event=cancel_event, output_paths=last_outputs['paths'])
             # Update UI from main thread
             def finish_ui():
+                flush_log()
                 try:
                     run_btn.configure(state='normal')
                     cancel_btn.configure(state='disabled')
@@ -939,10 +1282,16 @@ def launch_gui():
         log("Cancellation requested…")
 
     def clear_log():
+        flush_log()
         log_text.configure(state='normal')
         log_text.delete('1.0', 'end')
         log_text.configure(state='disabled')
 
+    def open_in_finder(args):
+        # Don't wait for Finder: subprocess.run would hold the Tk thread until `open` exits
+        subprocess.Popen(['open', *args], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+
     def open_output_location():
         # If the user set an Output Folder, prioritize opening that location
         outp = (out_var.get().strip() or '')
@@ -950,7 +1299,7 @@ def launch_gui():
         if outp:
             try:
                 folder = outp if os.path.isdir(outp) else os.path.dirname(outp)
-                subprocess.run(['open', folder], check=False)
+                open_in_finder([folder])
                 return
             except Exception:
                 pass
@@ -959,7 +1308,7 @@ def launch_gui():
         if paths:
             target = paths[-1]  # last created ALE
             try:
-                subprocess.run(['open', '-R', target], check=False)
+                open_in_finder(['-R', target])
                 return
             except Exception:
                 pass
@@ -971,7 +1320,7 @@ def launch_gui():
             else:
                 wb = os.path.basename(os.path.normpath(wavp))
                 folder = os.path.join(os.path.dirname(os.path.normpath(wavp)), 'ALEs', wb)
-            subprocess.run(['open', folder], check=False)
+            open_in_finder([folder])
         except Exception:
             messagebox.showwarning("Open Location", "Could not open the ALE location.")
 
@@ -1046,6 +1395,7 @@ def launch_gui():
     
     frm.columnconfigure(0, weight=1)
 
+    poll_log()
     root.mainloop()
 
 def main():
@@ -1056,6 +1406,8 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1] in ('--version', '-v'):
         print(f"WAVsToALE v{__version__}")
         return
+    # --threads: parse with threads instead of worker processes (network volumes)
+    use_threads = "--threads" in sys.argv
     
     # Try to find UCS CSV in the script directory first
     try:
@@ -1113,7 +1465,8 @@ def main():
     
     # Check if input is a single file or directory
     is_single_file = os.path.isfile(wav_path)
-    is_directory = os.path.isdir(wav_path)
+    # A regular file can't be a directory too: skip the second stat
+    is_directory = not is_single_file and os.path.isdir(wav_path)
     
     if not is_single_file and not is_directory:
         print(f"Error: Path does not exist or is not a file/directory: {wav_path}")
@@ -1170,9 +1523,8 @@ def main():
     # Directory handling (existing code)
     wav_directory = wav_path
     # If user didn't provide an output path, default to subdirectory next to WAV directory
-    wav_basename = os.path.basename(os.path.normpath(wav_directory))
     # Default ALEs folder is subdirectory next to the WAV directory
-    wav_parent = os.path.dirname(os.path.normpath(wav_directory))
+    wav_parent, wav_basename = os.path.split(os.path.normpath(wav_directory))
     ales_dir = os.path.join(wav_parent, 'ALEs')
     # Ensure the ALEs directory exists
     try:
@@ -1205,14 +1557,6 @@ def main():
     #   original behavior and write a single ALE containing all WAVs found only
     #   at the top-level of the provided directory.
 
-    # Recursively walk the WAV directory and group WAV files by directory.
-    # We'll create one ALE per directory that contains WAV files.
-    dir_wav_map = {}
-    for dirpath, dirnames, filenames in os.walk(wav_directory):
-        wavs = [os.path.join(dirpath, f) for f in filenames if f.lower().endswith('.wav')]
-        if wavs:
-            dir_wav_map[dirpath] = wavs
-
     # Determine the directory to place per-subdir ALEs
     # If user explicitly provided an output file, use its parent; otherwise use ALEs folder
     explicit_output_requested = bool(output_ale_file)
@@ -1232,17 +1576,23 @@ def main():
     # Was the user asking for a single explicit output file? If they provided a non-directory
     # output path, treat it as an explicit single-file request and keep the old behavior.
     user_requested_single_file = bool(raw_out and raw_out.strip() and not os.path.isdir(raw_out))
+    cache = MetadataCache(ales_output_root, fps, ucs_csv_file)
+
+    # Recursively walk the WAV directory and group WAV files by directory.
+    # We'll create one ALE per directory that contains WAV files.
+    dir_wav_map, _ = scan_audio_dirs(wav_directory, stats=cache.stats)
 
     if user_requested_single_file:
         # Single-file behavior: collect only top-level WAVs (not recursive)
-        top_level_wavs = [p for p in dir_wav_map.get(wav_directory, [])]
+        top_level_wavs = dir_wav_map.get(wav_directory, ())
         if not top_level_wavs:
             print(f"Error: No WAV files found in the directory '{wav_directory}'.")
             return
 
         start_len = len(SKIP_LOG)
-        with ThreadPoolExecutor() as executor:
-            metadata_list = list(executor.map(lambda p: parse_wav_metadata(p, fps), top_level_wavs))
+        with make_parse_executor(use_threads) as executor:
+            metadata_list = parse_wavs(top_level_wavs, fps, executor, cache)
+        cache.save()
         metadata_list = [m for m in metadata_list if m]
 
         create_ale_file(metadata_list, output_ale_file, fps)
@@ -1250,37 +1600,9 @@ def main():
             try:
                 skip_log_path = output_ale_file + '.skip.log'
                 skipped_entries = SKIP_LOG[start_len:]
-                total_processed = len(top_level_wavs)
-                total_skipped = len(skipped_entries)
-                total_successful = len(metadata_list)
-                
-                # Count errors by type
-                error_counts = {}
-                for entry in skipped_entries:
-                    if '\t' in entry:
-                        error_type = entry.split('\t', 1)[1].split(':')[0]
-                        error_counts[error_type] = error_counts.get(error_type, 0) + 1
-                
-                with open(skip_log_path, 'w', encoding='utf-8') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write("SKIP LOG SUMMARY\n")
-                    f.write("=" * 80 + "\n")
-                    f.write(f"Total files processed: {total_processed}\n")
-                    f.write(f"Successfully parsed: {total_successful}\n")
-                    f.write(f"Skipped (errors): {total_skipped}\n")
-                    f.write("\n")
-                    if error_counts:
-                        f.write("Errors by type:\n")
-                        for error_type, count in sorted(error_counts.items()):
-                            f.write(f"  {error_type}: {count}\n")
-                    f.write("=" * 80 + "\n")
-                    f.write("\n")
-                    f.write("DETAILED ERROR LOG\n")
-                    f.write("-" * 80 + "\n")
-                    for line in skipped_entries:
-                        f.write(line + '\n')
-            except Exception:
-                pass
+                write_skip_log(skip_log_path, format_skip_log(len(top_level_wavs), len(metadata_list), skipped_entries))
+            except Exception as e:
+                print(f"Could not write skip log {skip_log_path}: {e}")
 
     else:
         # Recursive behavior: create an ALE for every directory that contains WAVs
@@ -1288,67 +1610,48 @@ def main():
             print(f"Error: No WAV files found in the directory '{wav_directory}'.")
             return
 
-        for dirpath, wavs in sorted(dir_wav_map.items()):
-            # Determine a mirrored output directory under ales_output_root
-            rel = os.path.relpath(dirpath, wav_directory)
-            if rel == '.':
-                target_dir = ales_output_root
-            else:
-                target_dir = os.path.join(ales_output_root, rel)
-            try:
-                os.makedirs(target_dir, exist_ok=True)
-            except Exception:
-                pass
-
-            out_file = os.path.join(target_dir, f"{os.path.basename(dirpath)}.ale")
-
-            start_len = len(SKIP_LOG)
-            with ThreadPoolExecutor() as executor:
-                metadata_list = list(executor.map(lambda p: parse_wav_metadata(p, fps), wavs))
-            metadata_list = [m for m in metadata_list if m]
+        dir_items = sorted(dir_wav_map.items())
+        # Subdirectory paths from scan_audio_dirs() all start with the root
+        root_prefix = os.path.join(wav_directory, '')
+        with make_parse_executor(use_threads) as executor:
+            parsed = iter_parse_wavs((wavs for _, wavs in dir_items), fps, executor, cache)
+            for dirpath, wavs in dir_items:
+                # Determine a mirrored output directory under ales_output_root
+                rel = '.' if dirpath == wav_directory else dirpath[len(root_prefix):]
+                if rel == '.':
+                    target_dir = ales_output_root
+                else:
+                    target_dir = os.path.join(ales_output_root, rel)
+                try:
+                    os.makedirs(target_dir, exist_ok=True)
+                except Exception:
+                    pass
 
-            if metadata_list:
-                actual_path = create_ale_file(metadata_list, out_file, fps)
-                if actual_path and actual_path != out_file:
-                    out_file = actual_path  # Update for skip log filename
-                # Write per-ALE skip log entries
-                if len(SKIP_LOG) > start_len:
-                    try:
-                        skip_log_path = out_file + '.skip.log'
-                        skipped_entries = SKIP_LOG[start_len:]
-                        total_processed = len(wavs)
-                        total_skipped = len(skipped_entries)
-                        total_successful = len(metadata_list)
-                        
-                        # Count errors by type
-                        error_counts = {}
-                        for entry in skipped_entries:
-                            if '\t' in entry:
-                                error_type = entry.split('\t', 1)[1].split(':')[0]
-                                error_counts[error_type] = error_counts.get(error_type, 0) + 1
-                        
-                        with open(skip_log_path, 'w', encoding='utf-8') as f:
-                            f.write("=" * 80 + "\n")
-                            f.write("SKIP LOG SUMMARY\n")
-                            f.write("=" * 80 + "\n")
-                            f.write(f"Total files processed: {total_processed}\n")
-                            f.write(f"Successfully parsed: {total_successful}\n")
-                            f.write(f"Skipped (errors): {total_skipped}\n")
-                            f.write("\n")
-                            if error_counts:
-                                f.write("Errors by type:\n")
-                                for error_type, count in sorted(error_counts.items()):
-                                    f.write(f"  {error_type}: {count}\n")
-                            f.write("=" * 80 + "\n")
-                            f.write("\n")
-                            f.write("DETAILED ERROR LOG\n")
-                            f.write("-" * 80 + "\n")
-                            for line in skipped_entries:
-                                f.write(line + '\n')
-                    except Exception:
-                        pass
+                out_file = os.path.join(target_dir, f"{os.path.basename(dirpath)}.ale")
+
+                start_len = len(SKIP_LOG)
+                metadata_list = next(parsed)
+                metadata_list = [m for m in metadata_list if m]
+
+                if metadata_list:
+                    actual_path = create_ale_file(metadata_list, out_file, fps)
+                    if actual_path and actual_path != out_file:
+                        out_file = actual_path  # Update for skip log filename
+                    # Write per-ALE skip log entries
+                    if len(SKIP_LOG) > start_len:
+                        try:
+                            skip_log_path = out_file + '.skip.log'
+                            skipped_entries = SKIP_LOG[start_len:]
+                            write_skip_log(skip_log_path, format_skip_log(len(wavs), len(metadata_list), skipped_entries))
+                        except Exception as e:
+                            print(f"Could not write skip log {skip_log_path}: {e}")
+        cache.save()
 
 if __name__ == "__main__":
+    # Required for the parsing process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+    _probe_tk()
+
     # Auto-launch GUI when frozen (packaged app) unless --no-gui is specified
     # Or when --gui is explicitly requested
     is_frozen = getattr(sys, 'frozen', False)